@@ -5,7 +5,12 @@ Creates sample duplicate images, scans them, reviews them, and demonstrates
 the safety features.
 """
 
-import shutil
+import io
+import os.path
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -17,58 +22,147 @@ from image_organizer.ui.review import ReviewUI
 from image_organizer.utils.config import Config
 
 
+# Holds the demo TemporaryDirectory so background cleanup can outlive main()
+_demo_tmpdir = None
+
+
+@lru_cache(maxsize=1)
+def _config() -> Config:
+    """Shared Config instance (parsed once per process)."""
+    return Config()
+
+
+@lru_cache(maxsize=1)
+def _scanner() -> ImageScanner:
+    """Shared ImageScanner instance."""
+    return ImageScanner(_config())
+
+
+@lru_cache(maxsize=1)
+def _detector() -> DuplicateDetector:
+    """Shared DuplicateDetector instance."""
+    return DuplicateDetector(_config(), show_progress=True)
+
+
+@lru_cache(maxsize=1)
+def _review_ui() -> ReviewUI:
+    """Shared ReviewUI instance."""
+    return ReviewUI()
+
+
+def _encode(size: tuple, color: tuple, quality: int) -> bytes:
+    """
+    Encode a solid-color JPEG once into an in-memory buffer.
+
+    Args:
+        size: Image dimensions as (width, height)
+        color: RGB color tuple
+        quality: JPEG quality setting
+
+    Returns:
+        Encoded JPEG bytes
+    """
+    buf = io.BytesIO()
+    Image.new("RGB", size, color).save(buf, "JPEG", quality=quality)
+    return buf.getvalue()
+
+
+def _solid_bmp(size: tuple, color: tuple) -> bytes:
+    """
+    Build an uncompressed 24-bit BMP of a single color without PIL.
+
+    Avoids JPEG entropy coding entirely for fixtures where the codec is
+    irrelevant to the demo. Width must keep rows 4-byte aligned
+    (width * 3 divisible by 4), which holds for all demo sizes.
+
+    Args:
+        size: Image dimensions as (width, height)
+        color: RGB color tuple
+
+    Returns:
+        Complete BMP file bytes
+    """
+    width, height = size
+    r, g, b = color
+    row_bytes = width * 3
+    assert row_bytes % 4 == 0, "demo BMP widths must keep rows 4-byte aligned"
+    pixel_data = struct.pack("<BBB", b, g, r) * (width * height)
+
+    # 14-byte file header + 40-byte BITMAPINFOHEADER
+    header = struct.pack(
+        "<2sIHHIIiiHHIIiiII",
+        b"BM",
+        54 + len(pixel_data),  # file size
+        0,
+        0,
+        54,  # pixel data offset
+        40,  # info header size
+        width,
+        height,
+        1,  # planes
+        24,  # bits per pixel
+        0,  # no compression
+        len(pixel_data),
+        2835,  # ~72 DPI horizontal
+        2835,  # ~72 DPI vertical
+        0,
+        0,
+    )
+    return header + pixel_data
+
+
 def create_demo_images(demo_dir: Path) -> None:
     """
     Create sample images for demonstration.
-    
+
     Args:
         demo_dir: Directory to create images in
     """
     print(f"Creating demo images in: {demo_dir}")
-    
+
     # Create a few original images
     originals_dir = demo_dir / "originals"
     originals_dir.mkdir(exist_ok=True)
-    
-    # Original 1: High quality landscape
-    img1 = Image.new("RGB", (1920, 1080), color=(70, 130, 180))  # Steel blue
-    img1.save(originals_dir / "landscape_1920x1080.jpg", "JPEG", quality=95)
-    
-    # Original 2: Medium quality portrait
-    img2 = Image.new("RGB", (800, 1200), color=(220, 20, 60))  # Crimson
-    img2.save(originals_dir / "portrait_800x1200.jpg", "JPEG", quality=85)
-    
-    # Original 3: Small image
-    img3 = Image.new("RGB", (640, 480), color=(50, 205, 50))  # Lime green
-    img3.save(originals_dir / "small_640x480.jpg", "JPEG", quality=75)
-    
+
     # Create duplicates directory
     duplicates_dir = demo_dir / "duplicates"
     duplicates_dir.mkdir(exist_ok=True)
-    
-    # Duplicate 1: Copy of landscape (exact duplicate)
-    shutil.copy(
-        originals_dir / "landscape_1920x1080.jpg",
-        duplicates_dir / "landscape_copy.jpg"
-    )
-    
-    # Duplicate 2: Lower quality version of landscape
-    img1_low = Image.new("RGB", (1280, 720), color=(70, 130, 180))
-    img1_low.save(duplicates_dir / "landscape_1280x720.jpg", "JPEG", quality=60)
-    
-    # Duplicate 3: Copy of portrait
-    shutil.copy(
-        originals_dir / "portrait_800x1200.jpg",
-        duplicates_dir / "portrait_copy.jpg"
-    )
-    
+
     # Create protected directory (should be skipped)
     protected_dir = demo_dir / "Family_Photos"
     protected_dir.mkdir(exist_ok=True)
-    
-    img_protected = Image.new("RGB", (1024, 768), color=(255, 215, 0))  # Gold
-    img_protected.save(protected_dir / "important_memory.jpg", "JPEG", quality=90)
-    
+
+    # Only the landscape trio exercises the lower-quality-duplicate case
+    # and needs real JPEG encoding; libjpeg releases the GIL, so the two
+    # unique encodes run in parallel threads.
+    encodes = [
+        ((1920, 1080), (70, 130, 180), 95),  # Steel blue landscape
+        ((1280, 720), (70, 130, 180), 60),  # Low-quality landscape
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        landscape_bytes, landscape_low_bytes = executor.map(lambda t: _encode(*t), encodes)
+
+    # The remaining solid-color fixtures skip the codec entirely and are
+    # written as uncompressed BMPs (the scanner accepts .bmp).
+    portrait_bytes = _solid_bmp((800, 1200), (220, 20, 60))  # Crimson
+    small_bytes = _solid_bmp((640, 480), (50, 205, 50))  # Lime green
+    gold_bytes = _solid_bmp((1024, 768), (255, 215, 0))  # Gold
+
+    # Originals
+    (originals_dir / "landscape_1920x1080.jpg").write_bytes(landscape_bytes)
+    (originals_dir / "portrait_800x1200.bmp").write_bytes(portrait_bytes)
+    (originals_dir / "small_640x480.bmp").write_bytes(small_bytes)
+
+    # Exact duplicates reuse the already-encoded bytes
+    (duplicates_dir / "landscape_copy.jpg").write_bytes(landscape_bytes)
+    (duplicates_dir / "portrait_copy.bmp").write_bytes(portrait_bytes)
+
+    # Lower quality version of landscape
+    (duplicates_dir / "landscape_1280x720.jpg").write_bytes(landscape_low_bytes)
+
+    # Protected image (should be skipped by the scanner)
+    (protected_dir / "important_memory.bmp").write_bytes(gold_bytes)
+
     print(f"✓ Created 7 images (3 originals, 3 duplicates, 1 protected)")
 
 
@@ -78,77 +172,91 @@ def main():
     print("IMAGE ORGANIZER - END-TO-END DEMO")
     print("=" * 70)
     print()
+
+    # Kept alive at module scope so the background cleanup thread can
+    # finish after main() returns
+    global _demo_tmpdir
+    _demo_tmpdir = TemporaryDirectory(ignore_cleanup_errors=True)
+    demo_dir = Path(_demo_tmpdir.name) / "demo"
+    demo_dir.mkdir()
     
-    with TemporaryDirectory() as temp_dir:
-        demo_dir = Path(temp_dir) / "demo"
-        demo_dir.mkdir()
-        
-        # Step 1: Create demo images
-        print("STEP 1: Creating demo images")
-        print("-" * 70)
-        create_demo_images(demo_dir)
-        print()
-        
-        # Step 2: Scan for images
-        print("STEP 2: Scanning for images")
-        print("-" * 70)
-        config = Config()
-        scanner = ImageScanner(config)
-        image_paths = scanner.scan_directory(demo_dir, recursive=True)
-        print(f"✓ Found {len(image_paths)} images")
-        for path in image_paths:
-            print(f"  - {path.relative_to(demo_dir)}")
-        print()
-        
-        # Step 3: Detect duplicates
-        print("STEP 3: Detecting duplicates")
-        print("-" * 70)
-        detector = DuplicateDetector(config, show_progress=True)
-        duplicates = detector.find_duplicates(image_paths)
-        
-        print(f"✓ Found {len(duplicates)} duplicate groups")
-        for original, dups in duplicates.items():
-            print(f"\n  Original: {Path(original).name}")
-            for dup_path, similarity in dups:
-                print(f"    → Duplicate: {Path(dup_path).name} (similarity: {100 - similarity:.1f}%)")
-        print()
-        
-        # Step 4: Review duplicates
-        print("STEP 4: Reviewing duplicates (auto-recommendation)")
-        print("-" * 70)
-        if duplicates:
-            review_ui = ReviewUI()
-            decisions = review_ui.review_duplicates(
-                duplicates,
-                auto_select_recommendations=True
+    # Step 1: Create demo images
+    print("STEP 1: Creating demo images")
+    print("-" * 70)
+    create_demo_images(demo_dir)
+    print()
+    
+    # Step 2: Scan for images
+    print("STEP 2: Scanning for images")
+    print("-" * 70)
+    scanner = _scanner()
+    image_paths = scanner.scan_directory(demo_dir, recursive=True)
+    print(f"✓ Found {len(image_paths)} images")
+    for path in image_paths:
+        print(f"  - {path.relative_to(demo_dir)}")
+    print()
+    
+    # Step 3: Detect duplicates
+    print("STEP 3: Detecting duplicates")
+    print("-" * 70)
+    detector = _detector()
+    duplicates = detector.find_duplicates(image_paths)
+    
+    # Buffer the report and emit it in one write instead of one syscall
+    # per duplicate pair; os.path.basename avoids constructing a PurePath
+    # just for the name
+    lines = [f"✓ Found {len(duplicates)} duplicate groups"]
+    for original, dups in duplicates.items():
+        lines.append(f"\n  Original: {os.path.basename(original)}")
+        for dup_path, similarity in dups:
+            lines.append(
+                f"    → Duplicate: {os.path.basename(dup_path)} (similarity: {100 - similarity:.1f}%)"
             )
-            
-            print(f"\n✓ Review complete")
-            print(f"  Files to keep: {len(decisions['keep'])}")
-            print(f"  Files to delete: {len(decisions['delete'])}")
-            
-            print("\n  Recommended for deletion:")
-            for file_path in decisions['delete'][:5]:  # Show first 5
-                print(f"    - {Path(file_path).name}")
-            
-            if len(decisions['delete']) > 5:
-                print(f"    ... and {len(decisions['delete']) - 5} more")
-        else:
-            print("  No duplicates found to review")
-        print()
+    print("\n".join(lines))
+    print()
+    
+    # Step 4: Review duplicates
+    print("STEP 4: Reviewing duplicates (auto-recommendation)")
+    print("-" * 70)
+    if duplicates:
+        review_ui = _review_ui()
+        decisions = review_ui.review_duplicates(
+            duplicates,
+            auto_select_recommendations=True
+        )
+        
+        print(f"\n✓ Review complete")
+        print(f"  Files to keep: {len(decisions['keep'])}")
+        print(f"  Files to delete: {len(decisions['delete'])}")
         
-        # Step 5: Summary
-        print("STEP 5: Summary")
-        print("-" * 70)
-        print("✓ Demo completed successfully!")
-        print()
-        print("In a real workflow, you would now:")
-        print("  1. Review the duplicates interactively")
-        print("  2. Stage selected files for deletion")
-        print("  3. Confirm deletion (moves to recycle bin)")
-        print("  4. Or undo if you change your mind")
-        print()
-        print("=" * 70)
+        delete_lines = ["\n  Recommended for deletion:"]
+        delete_lines.extend(
+            f"    - {os.path.basename(file_path)}"
+            for file_path in decisions['delete'][:5]  # Show first 5
+        )
+        if len(decisions['delete']) > 5:
+            delete_lines.append(f"    ... and {len(decisions['delete']) - 5} more")
+        print("\n".join(delete_lines))
+    else:
+        print("  No duplicates found to review")
+    print()
+    
+    # Step 5: Summary
+    print("STEP 5: Summary")
+    print("-" * 70)
+    print("✓ Demo completed successfully!")
+    print()
+    print("In a real workflow, you would now:")
+    print("  1. Review the duplicates interactively")
+    print("  2. Stage selected files for deletion")
+    print("  3. Confirm deletion (moves to recycle bin)")
+    print("  4. Or undo if you change your mind")
+    print()
+    print("=" * 70)
+
+    # Reclaim the demo directory off the critical path; the prompt
+    # returns while the OS finishes unlinking files
+    threading.Thread(target=_demo_tmpdir.cleanup, daemon=True).start()
 
 
 if __name__ == "__main__":
@@ -8,8 +8,25 @@ eliminating duplicate/near-duplicate images with a safety-first approach.
 __version__ = "0.1.0"
 __author__ = "Image Organizer Contributors"
 
-from image_organizer.core.detector import DuplicateDetector
-from image_organizer.core.scanner import ImageScanner
-from image_organizer.core.staging import SafeImageDeleter
-
 __all__ = ["DuplicateDetector", "ImageScanner", "SafeImageDeleter", "__version__"]
+
+
+def __getattr__(name: str) -> object:
+    """Lazily resolve top-level exports (PEP 562).
+
+    The core modules pull in PIL, imagededup, and tqdm; deferring them keeps
+    short-lived invocations (e.g. --help, --version) fast.
+    """
+    if name == "DuplicateDetector":
+        from image_organizer.core.detector import DuplicateDetector
+
+        return DuplicateDetector
+    if name == "ImageScanner":
+        from image_organizer.core.scanner import ImageScanner
+
+        return ImageScanner
+    if name == "SafeImageDeleter":
+        from image_organizer.core.staging import SafeImageDeleter
+
+        return SafeImageDeleter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,139 @@
 """Command-line interface for image-organizer."""
 
 import json
+import os.path
 import sys
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 from typing import List, Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from image_organizer import __version__
-from image_organizer.core.detector import DuplicateDetector
-from image_organizer.core.scanner import ImageScanner
-from image_organizer.core.staging import SafeImageDeleter
-from image_organizer.ui.review import ReviewUI
 from image_organizer.utils.config import Config
 from image_organizer.utils.logger import setup_logger
+from image_organizer.utils.serialization import dump_json, dumps_json, load_json
 
-console = Console()
+# DuplicateDetector, ImageScanner, SafeImageDeleter, and ReviewUI are
+# imported inside the commands that need them (as already done for
+# GoogleDriveClient) so that --help and unrelated subcommands don't pay
+# for the PIL/imagededup import graph. rich is deferred the same way:
+# Table is imported per command and the module console below only
+# constructs the real rich Console on first output.
+
+
+class _LazyConsole:
+    """Proxy that defers the rich import until the console is used."""
+
+    _real = None
+
+    def __getattr__(self, name: str):
+        real = _LazyConsole._real
+        if real is None:
+            from rich.console import Console
+
+            real = _LazyConsole._real = Console()
+        return getattr(real, name)
+
+
+console = _LazyConsole()
 logger = setup_logger(__name__)
 
 
+# Friendly display labels for document MIME types, checked in order
+_MIME_LABELS = (
+    ("pdf", "PDF"),
+    ("word", "Word"),
+    (".document", "Word"),
+    ("excel", "Excel"),
+    (".spreadsheet", "Excel"),
+    ("powerpoint", "PowerPoint"),
+    (".presentation", "PowerPoint"),
+    ("text/plain", "Text"),
+    ("text/csv", "CSV"),
+)
+
+
+def _friendly_type(mime: str) -> str:
+    """Map a MIME type to a short display label."""
+    for needle, label in _MIME_LABELS:
+        if needle in mime:
+            return label
+    return mime.split("/")[-1][:12]
+
+
+@lru_cache(maxsize=4096)
+def _fmt_size(size_bytes: int) -> str:
+    """Format a byte count as MB/KB/B for table display."""
+    size_mb = size_bytes / (1024 * 1024)
+    if size_mb >= 0.01:
+        return f"{size_mb:.2f} MB"
+    if size_bytes >= 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    return f"{size_bytes} B"
+
+
+def _truncate(name: str, width: int) -> str:
+    """Truncate a display name to width characters with an ellipsis."""
+    if len(name) > width:
+        return name[: width - 3] + "..."
+    return name
+
+
+# Hamming distance (0-64) to similarity percentage conversion factor
+_SIMILARITY_SCALE = 100 / 64
+
+
+# Keep-strategy choices and display descriptions, shared by the Drive
+# move/trash/execute commands so the option and its help stay in sync
+_STRATEGY_CHOICES = ("first", "last", "newest", "oldest", "largest", "smallest")
+_STRATEGY_DESC = {
+    "first": "first file in each group",
+    "last": "last file in each group",
+    "newest": "newest file (by modified date)",
+    "oldest": "oldest file (by modified date)",
+    "largest": "largest file (by size)",
+    "smallest": "smallest file (by size)",
+}
+
+
+def _exact_dupe_savings_bytes(groups: dict) -> int:
+    """Bytes recovered by keeping one file per duplicate group."""
+    return sum(
+        int(g[0].get("size", 0)) * (len(g) - 1) for g in groups.values()
+    )
+
+
+# Shared option types, constructed once at import instead of per decorator
+_DIR_PATH = click.Path(
+    exists=True, file_okay=False, dir_okay=True, resolve_path=True, path_type=Path
+)
+_OUTPUT_PATH = click.Path(path_type=Path)
+_INPUT_PATH = click.Path(exists=True, path_type=Path)
+_HASH_CHOICE = click.Choice(["phash", "dhash", "ahash", "whash"], case_sensitive=False)
+
+
+@lru_cache(maxsize=1)
+def _get_config() -> Config:
+    """Configuration shared across subcommands (loaded once per process)."""
+    return Config()
+
+
+@lru_cache(maxsize=64)
+def _parse_mime_list(raw: Optional[str]) -> Optional[tuple]:
+    """
+    Split a comma-separated MIME type option into a normalized tuple.
+
+    Cached so repeated invocations in the same process (scripting loops)
+    reuse the parsed value; the tuple is also hashable for downstream
+    caching.
+    """
+    if not raw:
+        return None
+    return tuple(mt.strip() for mt in raw.split(","))
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="image-organizer")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
@@ -47,14 +160,14 @@ def cli(ctx: click.Context, verbose: bool) -> None:
     "-p",
     "paths",
     multiple=True,
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    type=_DIR_PATH,
     required=True,
     help="Directory path(s) to scan for images",
 )
 @click.option(
     "--output",
     "-o",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="Output file for duplicate report (JSON)",
 )
 @click.option(
@@ -66,7 +179,7 @@ def cli(ctx: click.Context, verbose: bool) -> None:
 @click.option(
     "--hash-method",
     "-m",
-    type=click.Choice(["phash", "dhash", "ahash", "whash"], case_sensitive=False),
+    type=_HASH_CHOICE,
     help="Hash method to use (default: from config)",
 )
 @click.option(
@@ -80,6 +193,11 @@ def cli(ctx: click.Context, verbose: bool) -> None:
     default=True,
     help="Show progress bars",
 )
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent the JSON output (slower for large reports)",
+)
 @click.pass_context
 def scan(
     ctx: click.Context,
@@ -89,6 +207,7 @@ def scan(
     hash_method: Optional[str],
     recursive: bool,
     show_progress: bool,
+    pretty: bool,
 ) -> None:
     """
     Scan directories for duplicate images.
@@ -100,11 +219,15 @@ def scan(
     Example:
         image-organizer scan --path "C:\\Users\\John\\Pictures" --output duplicates.json
     """
-    config = Config()
+    from image_organizer.core.detector import DuplicateDetector
+    from image_organizer.core.scanner import ImageScanner
+
+    config = _get_config()
 
     # Override config with command-line options
     if hash_method:
-        config.set("hash_method", hash_method.lower())
+        # Click's case-insensitive Choice already normalized the value
+        config.set("hash_method", hash_method)
     if threshold is not None:
         config.set("similarity_threshold", threshold)
 
@@ -115,18 +238,47 @@ def scan(
     # Scan for images
     scanner = ImageScanner(config, show_progress=show_progress)
 
-    all_images: List[Path] = []
-    for path in paths:
-        console.print(f"[yellow]Scanning:[/yellow] {path}")
-        try:
-            images = scanner.scan_directory(
-                Path(path), recursive=recursive, skip_hidden=True
-            )
-            all_images.extend(images)
-        except Exception as e:
-            console.print(f"[red]Error scanning {path}:[/red] {e}", err=True)
-            continue
+    # Collect per-path result lists and flatten once at the end rather
+    # than growing a shared list incrementally
+    scan_results: List[List[Path]] = []
+    if len(paths) > 1:
+        # Directory scanning is stat/readdir bound, so scan the paths in
+        # parallel; the syscalls release the GIL
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        for path in paths:
+            console.print(f"[yellow]Scanning:[/yellow] {path}")
+
+        with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+            futures = {
+                executor.submit(
+                    scanner.scan_directory,
+                    path,
+                    recursive=recursive,
+                    skip_hidden=True,
+                ): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                try:
+                    scan_results.append(future.result())
+                except Exception as e:
+                    console.print(
+                        f"[red]Error scanning {futures[future]}:[/red] {e}"
+                    )
+    else:
+        for path in paths:
+            console.print(f"[yellow]Scanning:[/yellow] {path}")
+            try:
+                images = scanner.scan_directory(
+                    path, recursive=recursive, skip_hidden=True
+                )
+                scan_results.append(images)
+            except Exception as e:
+                console.print(f"[red]Error scanning {path}:[/red] {e}")
+                continue
 
+    all_images = list(chain.from_iterable(scan_results))
     if not all_images:
         console.print("[yellow]No images found to scan.[/yellow]")
         return
@@ -148,53 +300,69 @@ def scan(
 
         # Save to file if requested
         if output:
-            _save_duplicates_json(duplicates, output)
+            _save_duplicates_json(duplicates, output, pretty=pretty)
             console.print(f"\n[green]✓ Results saved to:[/green] {output}")
 
     except Exception as e:
-        console.print(f"[red]Error during duplicate detection:[/red] {e}", err=True)
+        console.print(f"[red]Error during duplicate detection:[/red] {e}")
         sys.exit(1)
 
 
 @cli.command()
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Emit operations as JSON (auto-enabled when stdout is piped)",
+)
 @click.pass_context
-def list_staging(ctx: click.Context) -> None:
+def list_staging(ctx: click.Context, as_json: bool) -> None:
     """
     List all staged operations (files ready for deletion).
 
     Shows operations that have been staged but not yet confirmed for deletion.
     """
-    config = Config()
+    from rich.table import Table
+    from image_organizer.core.staging import SafeImageDeleter
+
+    config = _get_config()
     deleter = SafeImageDeleter(config)
 
     operations = deleter.list_staged_operations()
 
-    if not operations:
-        console.print("[yellow]No staged operations found.[/yellow]")
-        return
-
     # Filter for staged (not yet deleted) operations
     staged_ops = [op for op in operations if op.get("status") == "staged"]
 
+    # When piping to jq or a file, skip the Rich render pipeline entirely
+    if as_json or not sys.stdout.isatty():
+        sys.stdout.buffer.write(dumps_json(staged_ops) + b"\n")
+        return
+
     if not staged_ops:
         console.print("[yellow]No staged operations found.[/yellow]")
         return
 
     console.print(f"\n[bold cyan]Staged Operations:[/bold cyan]\n")
 
-    for op in staged_ops:
-        table = Table(show_header=False, box=None)
-        table.add_column("Key", style="cyan")
-        table.add_column("Value")
+    # One table for all operations: Rich measures and renders the whole
+    # listing in a single pass instead of once per operation
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Operation ID", style="cyan")
+    table.add_column("Timestamp")
+    table.add_column("Reason")
+    table.add_column("Files", justify="right")
+    table.add_column("Status")
 
-        table.add_row("Operation ID", op["operation_id"])
-        table.add_row("Timestamp", op["timestamp"])
-        table.add_row("Reason", op["reason"])
-        table.add_row("Files", str(op["files_staged"]))
-        table.add_row("Status", op["status"])
+    for op in staged_ops:
+        table.add_row(
+            op["operation_id"],
+            op["timestamp"],
+            op["reason"],
+            str(op["files_staged"]),
+            op["status"],
+        )
 
-        console.print(table)
-        console.print()
+    console.print(table)
 
 
 @cli.command()
@@ -206,7 +374,9 @@ def undo(ctx: click.Context, operation_id: str) -> None:
 
     OPERATION_ID: ID of the operation to undo (from list-staging)
     """
-    config = Config()
+    from image_organizer.core.staging import SafeImageDeleter
+
+    config = _get_config()
     deleter = SafeImageDeleter(config)
 
     console.print(f"\n[yellow]Undoing operation:[/yellow] {operation_id}\n")
@@ -216,7 +386,7 @@ def undo(ctx: click.Context, operation_id: str) -> None:
     if success:
         console.print(f"[green]✓ Operation {operation_id} undone successfully![/green]")
     else:
-        console.print(f"[red]Failed to undo operation {operation_id}[/red]", err=True)
+        console.print(f"[red]Failed to undo operation {operation_id}[/red]")
         sys.exit(1)
 
 
@@ -231,7 +401,7 @@ def protect(ctx: click.Context, folder: str) -> None:
 
     Protected folders cannot have files deleted from them.
     """
-    config = Config()
+    config = _get_config()
     config.add_protected_folder(folder)
 
     console.print(f"[green]✓ Protected folder added:[/green] {folder}")
@@ -249,7 +419,7 @@ def unprotect(ctx: click.Context, folder: str) -> None:
     """
     Remove a folder from the protected folders list.
     """
-    config = Config()
+    config = _get_config()
     config.remove_protected_folder(folder)
 
     console.print(f"[green]✓ Protected folder removed:[/green] {folder}")
@@ -260,7 +430,7 @@ def unprotect(ctx: click.Context, folder: str) -> None:
     "--input",
     "-i",
     "input_file",
-    type=click.Path(exists=True, path_type=Path),
+    type=_INPUT_PATH,
     required=True,
     help="JSON file from 'scan' command with duplicate results",
 )
@@ -290,12 +460,12 @@ def review(
     Example:
         image-organizer review --input duplicates.json
     """
-    import json
+    from image_organizer.core.staging import SafeImageDeleter
+    from image_organizer.ui.review import ReviewUI
 
     # Load duplicates from JSON
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
-            duplicates = json.load(f)
+        duplicates = load_json(input_file)
     except Exception as e:
         console.print(f"[red]✗ Error loading duplicates file:[/red] {e}")
         sys.exit(1)
@@ -314,8 +484,10 @@ def review(
     )
 
     # Show summary
-    to_delete = [Path(p) for p in decisions["delete"]]
-    to_keep = [Path(p) for p in decisions["keep"]]
+    # Keep the decision lists as strings; Path objects are only
+    # materialized at the staging call that requires them
+    to_delete = decisions["delete"]
+    to_keep = decisions["keep"]
 
     if not to_delete:
         console.print("[yellow]No files selected for deletion.[/yellow]")
@@ -334,12 +506,12 @@ def review(
 
     # Stage files if requested
     if stage:
-        deleter = SafeImageDeleter()
+        deleter = SafeImageDeleter(_get_config())
         try:
             operation_id = deleter.stage_for_deletion(
-                to_delete,
+                [Path(p) for p in to_delete],
                 reason="Duplicate removal via review",
-                metadata={"keep": [str(p) for p in to_keep]},
+                metadata={"keep": to_keep},
             )
             console.print(
                 f"\n[bold green]✓ {len(to_delete)} files staged for deletion[/bold green]"
@@ -386,11 +558,13 @@ def confirm_delete(
     Example:
         image-organizer confirm-delete abc123 --recycle-bin
     """
-    deleter = SafeImageDeleter()
+    from image_organizer.core.staging import SafeImageDeleter
 
-    # Load operation metadata
-    operations = deleter.list_staged_operations()
-    operation = next((op for op in operations if op["id"] == operation_id), None)
+    deleter = SafeImageDeleter(_get_config())
+
+    # Load the single operation's metadata directly by ID instead of
+    # listing and scanning every staged operation
+    operation = deleter.get_operation(operation_id)
 
     if not operation:
         console.print(f"[red]✗ Operation '{operation_id}' not found.[/red]")
@@ -403,7 +577,7 @@ def confirm_delete(
         console.print(f"[dim]Current status: {operation['status']}[/dim]")
         sys.exit(1)
 
-    file_count = len(operation["files_staged"])
+    file_count = operation["files_staged"]
     action = "moved to recycle bin" if recycle_bin else "permanently deleted"
 
     # Show confirmation
@@ -442,7 +616,7 @@ def confirm_delete(
 @click.option(
     "--credentials",
     "-c",
-    type=click.Path(exists=True, path_type=Path),
+    type=_INPUT_PATH,
     help="Path to OAuth 2.0 credentials JSON file",
 )
 @click.pass_context
@@ -488,7 +662,7 @@ def drive_auth(ctx: click.Context, credentials: Optional[Path]) -> None:
 @click.option(
     "--output",
     "-o",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="Output file for duplicate report (JSON)",
 )
 @click.option(
@@ -526,6 +700,11 @@ def drive_auth(ctx: click.Context, credentials: Optional[Path]) -> None:
     default=True,
     help="Detect duplicates or just list files",
 )
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent the JSON output (slower for large reports)",
+)
 @click.pass_context
 def drive_scan_docs(
     ctx: click.Context,
@@ -537,6 +716,7 @@ def drive_scan_docs(
     mime_type: Optional[str],
     exclude_mime_type: Optional[str],
     detect_duplicates: bool,
+    pretty: bool,
 ) -> None:
     """
     Scan Google Drive for duplicate documents.
@@ -564,6 +744,7 @@ def drive_scan_docs(
         # Just list documents
         image-organizer drive-scan-docs --list-only
     """
+    from rich.table import Table
     from image_organizer.platforms.google_drive import GoogleDriveClient, DOCUMENT_MIME_TYPES
 
     try:
@@ -584,17 +765,15 @@ def drive_scan_docs(
             console.print("[cyan]Scanning entire Google Drive for documents...[/cyan]")
         
         # Parse MIME types - default to all document types if none specified
-        mime_types_list = None
-        if mime_type:
-            mime_types_list = [mt.strip() for mt in mime_type.split(',')]
+        mime_types_list = _parse_mime_list(mime_type)
+        if mime_types_list:
             console.print(f"[dim]Filtering to: {', '.join(mime_types_list)}[/dim]")
         else:
             mime_types_list = DOCUMENT_MIME_TYPES
             console.print("[dim]Scanning for: Word, Excel, PowerPoint, PDF, Text, CSV, Google Docs/Sheets/Slides[/dim]")
-        
-        exclude_mime_types_list = None
-        if exclude_mime_type:
-            exclude_mime_types_list = [mt.strip() for mt in exclude_mime_type.split(',')]
+
+        exclude_mime_types_list = _parse_mime_list(exclude_mime_type)
+        if exclude_mime_types_list:
             console.print(f"[dim]Excluding: {', '.join(exclude_mime_types_list)}[/dim]")
         
         # List files
@@ -608,9 +787,10 @@ def drive_scan_docs(
         )
         
         console.print(f"[bold green]✓ Found {len(files)} document files[/bold green]\n")
-        
-        # Show sample
-        if files:
+
+        # Show sample (skip the formatting work entirely when stdout is
+        # piped; the table would be discarded by most consumers anyway)
+        if files and console.is_terminal:
             table = Table(title="Sample Documents", show_header=True, header_style="bold cyan")
             table.add_column("#", width=4)
             table.add_column("Name", width=40)
@@ -618,48 +798,20 @@ def drive_scan_docs(
             table.add_column("Size", justify="right", width=10)
             table.add_column("Modified", justify="right", width=12)
             
-            for i, file in enumerate(files[:10], 1):
-                size_bytes = int(file.get("size", 0))
-                size_mb = size_bytes / (1024 * 1024)
-                modified = file.get("modifiedTime", "Unknown")[:10]
-                mime = file.get("mimeType", "")
-                
-                # Friendly type names
-                if "pdf" in mime:
-                    type_display = "PDF"
-                elif "word" in mime or ".document" in mime:
-                    type_display = "Word"
-                elif "excel" in mime or ".spreadsheet" in mime:
-                    type_display = "Excel"
-                elif "powerpoint" in mime or ".presentation" in mime:
-                    type_display = "PowerPoint"
-                elif "text/plain" in mime:
-                    type_display = "Text"
-                elif "text/csv" in mime:
-                    type_display = "CSV"
-                else:
-                    type_display = mime.split("/")[-1][:12]
-                
-                # Format size
-                if size_mb >= 0.01:
-                    size_display = f"{size_mb:.2f} MB"
-                elif size_bytes >= 1024:
-                    size_display = f"{size_bytes / 1024:.1f} KB"
-                else:
-                    size_display = f"{size_bytes} B"
-                
-                name_display = file.get("name", "Unknown")
-                if len(name_display) > 40:
-                    name_display = name_display[:37] + "..."
-                
-                table.add_row(
+            # Precompute all display cells, then feed Rich in one pass
+            rows = [
+                (
                     str(i),
-                    name_display,
-                    type_display,
-                    size_display,
-                    modified,
+                    _truncate(file.get("name", "Unknown"), 40),
+                    _friendly_type(file.get("mimeType", "")),
+                    _fmt_size(int(file.get("size") or 0)),
+                    file.get("modifiedTime", "Unknown")[:10],
                 )
-            
+                for i, file in enumerate(islice(files, 10), 1)
+            ]
+            for row in rows:
+                table.add_row(*row)
+
             console.print(table)
             
             if len(files) > 10:
@@ -671,15 +823,14 @@ def drive_scan_docs(
             duplicates = client.find_exact_duplicates_by_md5(files)
             
             if duplicates:
-                # Calculate space savings
-                total_duplicate_size = 0
-                duplicate_count = 0
-                for md5, dup_files in duplicates.items():
-                    file_size = int(dup_files[0].get("size", 0))
-                    num_duplicates = len(dup_files) - 1
-                    duplicate_count += num_duplicates
-                    total_duplicate_size += file_size * num_duplicates
-                
+                # Calculate space savings in one pass over the groups,
+                # using sizes already parsed to int when the listing came back
+                sizes = {f["id"]: int(f.get("size") or 0) for f in files}
+                duplicate_count = sum(len(g) - 1 for g in duplicates.values())
+                total_duplicate_size = sum(
+                    sizes[g[0]["id"]] * (len(g) - 1) for g in duplicates.values()
+                )
+
                 savings_mb = total_duplicate_size / (1024 * 1024)
                 savings_gb = savings_mb / 1024
                 
@@ -689,52 +840,37 @@ def drive_scan_docs(
                 )
                 console.print(f"[bold yellow]💾 Potential space savings: {savings_gb:.2f} GB ({savings_mb:.0f} MB)[/bold yellow]\n")
                 
-                # Show sample duplicates
-                table = Table(title="Duplicate Groups (Sample)", show_header=True, header_style="bold red")
-                table.add_column("Group", width=6)
-                table.add_column("File Name", width=40)
-                table.add_column("Size", justify="right", width=10)
-                table.add_column("ID", width=25)
-                
-                for group_num, (md5, dup_files) in enumerate(list(duplicates.items())[:5], 1):
-                    for file_num, file in enumerate(dup_files, 1):
-                        size_bytes = int(file.get("size", 0))
-                        size_mb = size_bytes / (1024 * 1024)
-                        
-                        if size_mb >= 0.01:
-                            size_display = f"{size_mb:.2f} MB"
-                        elif size_bytes >= 1024:
-                            size_display = f"{size_bytes / 1024:.1f} KB"
-                        else:
-                            size_display = f"{size_bytes} B"
-                        
-                        name_display = file["name"]
-                        if len(name_display) > 40:
-                            name_display = name_display[:37] + "..."
-                        
-                        table.add_row(
-                            f"{group_num}" if file_num == 1 else "",
-                            name_display,
-                            size_display,
-                            file["id"][:20] + "...",
-                        )
-                
-                console.print(table)
-                
-                if len(duplicates) > 5:
-                    console.print(f"[dim]... and {len(duplicates) - 5} more duplicate groups[/dim]\n")
+                # Show sample duplicates (terminal only, same as above)
+                if console.is_terminal:
+                    table = Table(title="Duplicate Groups (Sample)", show_header=True, header_style="bold red")
+                    table.add_column("Group", width=6)
+                    table.add_column("File Name", width=40)
+                    table.add_column("Size", justify="right", width=10)
+                    table.add_column("ID", width=25)
+
+                    for group_num, (md5, dup_files) in enumerate(islice(duplicates.items(), 5), 1):
+                        for file_num, file in enumerate(dup_files, 1):
+                            table.add_row(
+                                f"{group_num}" if file_num == 1 else "",
+                                _truncate(file["name"], 40),
+                                _fmt_size(sizes[file["id"]]),
+                                file["id"][:20] + "...",
+                            )
+
+                    console.print(table)
+
+                    if len(duplicates) > 5:
+                        console.print(f"[dim]... and {len(duplicates) - 5} more duplicate groups[/dim]\n")
                 
                 # Save to file
                 if output:
-                    with output.open("w") as f:
-                        json.dump(duplicates, f, indent=2)
+                    dump_json(duplicates, output, pretty=pretty)
                     console.print(f"[bold green]✓ Results saved to {output}[/bold green]")
                     console.print("[dim]You can edit this file to select which duplicates to remove[/dim]")
             else:
                 console.print("[green]✓ No duplicates found![/green]")
                 if output:
-                    with output.open("w") as f:
-                        json.dump({}, f, indent=2)
+                    dump_json({}, output, pretty=pretty)
                     console.print(f"[dim]Empty results saved to {output}[/dim]")
         
     except Exception as e:
@@ -747,7 +883,7 @@ def drive_scan_docs(
 @click.option(
     "--output",
     "-o",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="Output file for duplicate report (JSON)",
 )
 @click.option(
@@ -799,10 +935,21 @@ def drive_scan_docs(
 )
 @click.option(
     "--thumbnail-dir",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     default=None,
     help="Directory to store thumbnails (default: temp directory)",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=8,
+    help="Concurrent thumbnail downloads for near-duplicate detection",
+)
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent the JSON output (slower for large reports)",
+)
 @click.pass_context
 def drive_scan(
     ctx: click.Context,
@@ -817,6 +964,8 @@ def drive_scan(
     near_duplicates: bool,
     threshold: int,
     thumbnail_dir: Optional[Path],
+    workers: int,
+    pretty: bool,
 ) -> None:
     """
     Scan Google Drive for duplicate images.
@@ -853,8 +1002,8 @@ def drive_scan(
         # Just list files without detection
         image-organizer drive-scan --list-only
     """
+    from rich.table import Table
     from image_organizer.platforms.google_drive import GoogleDriveClient
-    import tempfile
 
     try:
         # Authenticate
@@ -874,14 +1023,12 @@ def drive_scan(
             console.print("[cyan]Scanning entire Google Drive for images...[/cyan]")
         
         # Parse MIME type filters
-        mime_types_list = None
-        if mime_type:
-            mime_types_list = [mt.strip() for mt in mime_type.split(',')]
+        mime_types_list = _parse_mime_list(mime_type)
+        if mime_types_list:
             console.print(f"[dim]Filtering to: {', '.join(mime_types_list)}[/dim]")
-        
-        exclude_mime_types_list = None
-        if exclude_mime_type:
-            exclude_mime_types_list = [mt.strip() for mt in exclude_mime_type.split(',')]
+
+        exclude_mime_types_list = _parse_mime_list(exclude_mime_type)
+        if exclude_mime_types_list:
             console.print(f"[dim]Excluding: {', '.join(exclude_mime_types_list)}[/dim]")
         
         # List files
@@ -904,16 +1051,19 @@ def drive_scan(
             table.add_column("Size", justify="right")
             table.add_column("Modified", justify="right")
             
-            for i, file in enumerate(files[:10], 1):
-                size_mb = int(file.get("size", 0)) / (1024 * 1024)
-                modified = file.get("modifiedTime", "Unknown")[:10]
-                table.add_row(
+            # Precompute all display cells, then feed Rich in one pass
+            rows = [
+                (
                     str(i),
                     file.get("name", "Unknown"),
-                    f"{size_mb:.2f} MB",
-                    modified,
+                    _fmt_size(int(file.get("size") or 0)),
+                    file.get("modifiedTime", "Unknown")[:10],
                 )
-            
+                for i, file in enumerate(islice(files, 10), 1)
+            ]
+            for row in rows:
+                table.add_row(*row)
+
             console.print(table)
             
             if len(files) > 10:
@@ -928,6 +1078,8 @@ def drive_scan(
                 
                 # Use temp directory if not specified
                 if thumbnail_dir is None:
+                    import tempfile
+
                     thumbnail_dir = Path(tempfile.mkdtemp(prefix="image_organizer_"))
                     console.print(f"[dim]Using temp directory: {thumbnail_dir}[/dim]\n")
                 
@@ -936,59 +1088,61 @@ def drive_scan(
                     thumbnail_dir=thumbnail_dir,
                     phash_threshold=threshold,
                     include_near_duplicates=True,
+                    max_workers=workers,
                 )
                 
                 exact_dupes = results['exact']
                 near_dupes = results['near']
                 stats = results['stats']
                 
-                # Display results
-                console.print("\n[bold cyan]═══ Exact Duplicates (MD5) ═══[/bold cyan]")
+                # Display results, built as one batch of lines so rich
+                # renders the summary in a single print
+                lines = ["\n[bold cyan]═══ Exact Duplicates (MD5) ═══[/bold cyan]"]
                 if exact_dupes:
-                    # Calculate space savings
-                    total_duplicate_size = 0
-                    for md5, dup_files in exact_dupes.items():
-                        file_size = int(dup_files[0].get("size", 0))
-                        num_duplicates = len(dup_files) - 1
-                        total_duplicate_size += file_size * num_duplicates
-                    
-                    savings_mb = total_duplicate_size / (1024 * 1024)
-                    
-                    console.print(
+                    savings_mb = _exact_dupe_savings_bytes(exact_dupes) / (1024 * 1024)
+
+                    lines.append(
                         f"[bold green]✓ Found {stats['exact_duplicate_groups']} groups "
                         f"({stats['exact_duplicate_files']} duplicate files)[/bold green]"
                     )
-                    console.print(f"[yellow]Space savings: {savings_mb:.1f} MB[/yellow]\n")
-                    
+                    lines.append(f"[yellow]Space savings: {savings_mb:.1f} MB[/yellow]\n")
+
                     # Show sample
                     sample_md5, sample_files = next(iter(exact_dupes.items()))
-                    console.print("[cyan]Example exact duplicate group:[/cyan]")
-                    for i, file in enumerate(sample_files[:3], 1):
-                        console.print(f"  {i}. {file.get('name')}")
+                    lines.append("[cyan]Example exact duplicate group:[/cyan]")
+                    lines.extend(
+                        f"  {i}. {file.get('name')}"
+                        for i, file in enumerate(islice(sample_files, 3), 1)
+                    )
                     if len(sample_files) > 3:
-                        console.print(f"  ... and {len(sample_files) - 3} more")
+                        lines.append(f"  ... and {len(sample_files) - 3} more")
                 else:
-                    console.print("[yellow]No exact duplicates found[/yellow]")
-                
-                console.print("\n[bold cyan]═══ Near-Duplicates (Perceptual Hash) ═══[/bold cyan]")
+                    lines.append("[yellow]No exact duplicates found[/yellow]")
+
+                lines.append("\n[bold cyan]═══ Near-Duplicates (Perceptual Hash) ═══[/bold cyan]")
                 if near_dupes:
-                    console.print(
+                    lines.append(
                         f"[bold green]✓ Found {stats['near_duplicate_groups']} files with similar images "
                         f"({stats['near_duplicate_pairs']} total pairs)[/bold green]\n"
                     )
-                    
-                    # Show sample
+
+                    # Show sample (id lookup via dict rather than an
+                    # O(N) scan over the full listing)
+                    files_by_id = {f["id"]: f for f in files}
                     sample_id, similar_files = next(iter(near_dupes.items()))
-                    sample_file = next(f for f in files if f['id'] == sample_id)
-                    console.print("[cyan]Example near-duplicate group:[/cyan]")
-                    console.print(f"  Original: {sample_file.get('name')}")
-                    console.print(f"  Similar to:")
-                    for i, sim in enumerate(similar_files[:3], 1):
-                        console.print(f"    {i}. {sim.get('name')}")
+                    sample_file = files_by_id[sample_id]
+                    lines.append("[cyan]Example near-duplicate group:[/cyan]")
+                    lines.append(f"  Original: {sample_file.get('name')}")
+                    lines.append("  Similar to:")
+                    lines.extend(
+                        f"    {i}. {sim.get('name')}"
+                        for i, sim in enumerate(islice(similar_files, 3), 1)
+                    )
                     if len(similar_files) > 3:
-                        console.print(f"    ... and {len(similar_files) - 3} more")
+                        lines.append(f"    ... and {len(similar_files) - 3} more")
                 else:
-                    console.print("[yellow]No near-duplicates found[/yellow]")
+                    lines.append("[yellow]No near-duplicates found[/yellow]")
+                console.print("\n".join(lines))
                 
                 # Save to JSON if requested
                 if output:
@@ -1005,7 +1159,7 @@ def drive_scan(
                         },
                         "stats": stats,
                     }
-                    output.write_text(json.dumps(output_data, indent=2))
+                    dump_json(output_data, output, pretty=pretty)
                     console.print(f"\n[green]✓ Results saved to:[/green] {output}")
                 
             else:
@@ -1014,15 +1168,7 @@ def drive_scan(
                 duplicates = client.find_exact_duplicates_by_md5(files)
                 
                 if duplicates:
-                    # Calculate space savings
-                    total_duplicate_size = 0
-                    for md5, dup_files in duplicates.items():
-                        # Keep one, delete the rest
-                        file_size = int(dup_files[0].get("size", 0))
-                        num_duplicates = len(dup_files) - 1
-                        total_duplicate_size += file_size * num_duplicates
-                    
-                    savings_mb = total_duplicate_size / (1024 * 1024)
+                    savings_mb = _exact_dupe_savings_bytes(duplicates) / (1024 * 1024)
                     
                     console.print(
                         f"[bold green]✓ Found {len(duplicates)} duplicate groups[/bold green]\n"
@@ -1056,7 +1202,7 @@ def drive_scan(
                                 for f in others
                             ]
                         
-                        _save_duplicates_json(json_duplicates, output)
+                        _save_duplicates_json(json_duplicates, output, pretty=pretty)
                         console.print(f"\n[green]✓ Results saved to:[/green] {output}")
                 else:
                     console.print("[yellow]No duplicates found![/yellow]")
@@ -1074,7 +1220,7 @@ def drive_scan(
     "-i",
     "input_file",
     required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=_INPUT_PATH,
     help="JSON file from drive-scan or drive-scan-docs",
 )
 @click.option(
@@ -1084,7 +1230,7 @@ def drive_scan(
 )
 @click.option(
     "--keep-strategy",
-    type=click.Choice(["first", "last", "newest", "oldest", "largest", "smallest"]),
+    type=click.Choice(_STRATEGY_CHOICES),
     default="first",
     help="Which file to keep in original location",
 )
@@ -1098,6 +1244,12 @@ def drive_scan(
     is_flag=True,
     help="Skip confirmation prompt (use with caution!)",
 )
+@click.option(
+    "--parallelism",
+    type=int,
+    default=8,
+    help="Concurrent move requests (Drive rate limits apply)",
+)
 @click.pass_context
 def drive_move_duplicates(
     ctx: click.Context,
@@ -1106,6 +1258,7 @@ def drive_move_duplicates(
     keep_strategy: str,
     dry_run: bool,
     confirm: bool,
+    parallelism: int,
 ) -> None:
     """
     Move duplicate files to a review folder in Google Drive.
@@ -1138,33 +1291,25 @@ def drive_move_duplicates(
             --input scan.json \\
             --confirm
     """
+    from rich.table import Table
     from image_organizer.platforms.google_drive import GoogleDriveClient
 
     try:
         # Load duplicates JSON
-        with input_file.open("r") as f:
-            duplicates = json.load(f)
+        duplicates = load_json(input_file)
         
         if not duplicates:
             console.print("[yellow]No duplicates found in input file.[/yellow]")
             return
         
-        # Count total files
+        # Count total files (one pass; each group keeps exactly one file)
         total_files = sum(len(files) for files in duplicates.values())
-        duplicate_count = sum(len(files) - 1 for files in duplicates.values())
+        duplicate_count = total_files - len(duplicates)
         
         console.print(f"[cyan]Loaded {len(duplicates)} duplicate groups ({duplicate_count} files to move)[/cyan]\n")
         
         # Show strategy info
-        strategy_desc = {
-            "first": "first file in each group",
-            "last": "last file in each group",
-            "newest": "newest file (by modified date)",
-            "oldest": "oldest file (by modified date)",
-            "largest": "largest file (by size)",
-            "smallest": "smallest file (by size)",
-        }
-        console.print(f"[bold]Keep strategy:[/bold] {strategy_desc[keep_strategy]}")
+        console.print(f"[bold]Keep strategy:[/bold] {_STRATEGY_DESC[keep_strategy]}")
         console.print(f"[bold]Folder name:[/bold] {folder_name or 'Auto-generated with timestamp'}\n")
         
         # Show sample of what will be moved
@@ -1175,30 +1320,28 @@ def drive_move_duplicates(
         table.add_column("File Name", width=50)
         table.add_column("Size", justify="right", width=10)
         
-        for group_num, (md5, file_list) in enumerate(list(duplicates.items())[:3], 1):
+        # Precompute all display cells, then feed Rich in one pass
+        rows = []
+        for group_num, (md5, file_list) in enumerate(islice(duplicates.items(), 3), 1):
             # Determine keep index (simplified for display)
             if keep_strategy == "last":
                 keep_idx = len(file_list) - 1
             else:  # "first" for preview
                 keep_idx = 0
-            
-            for i, file in enumerate(file_list):
-                action = "[green]KEEP[/green]" if i == keep_idx else "[yellow]MOVE[/yellow]"
-                size_bytes = int(file.get("size", 0))
-                size_mb = size_bytes / (1024 * 1024)
-                size_display = f"{size_mb:.2f} MB" if size_mb >= 0.01 else f"{size_bytes / 1024:.1f} KB"
-                
-                name_display = file.get("name", "Unknown")
-                if len(name_display) > 50:
-                    name_display = name_display[:47] + "..."
-                
-                table.add_row(
+
+            rows.extend(
+                (
                     f"{group_num}" if i == 0 else "",
-                    action,
-                    name_display,
-                    size_display,
+                    "[green]KEEP[/green]" if i == keep_idx else "[yellow]MOVE[/yellow]",
+                    _truncate(file.get("name", "Unknown"), 50),
+                    _fmt_size(int(file.get("size") or 0)),
                 )
-        
+                for i, file in enumerate(file_list)
+            )
+
+        for row in rows:
+            table.add_row(*row)
+
         console.print(table)
         
         if len(duplicates) > 3:
@@ -1230,13 +1373,19 @@ def drive_move_duplicates(
             console.print("[yellow]💡 Note: You may need to re-authenticate to grant write permissions[/yellow]")
             sys.exit(1)
         
-        # Move duplicates
+        # Move duplicates; a low refresh rate keeps the live display
+        # from stealing cycles while moves complete concurrently
+        from rich.progress import Progress
+
         console.print("\n[cyan]Moving duplicates...[/cyan]")
-        with console.status("[bold green]Processing..."):
+        with Progress(refresh_per_second=4, transient=True) as progress:
+            task = progress.add_task("Moving files", total=duplicate_count)
             moved, kept, folder_id = client.move_duplicates_to_folder(
                 duplicates,
                 folder_name=folder_name,
                 keep_strategy=keep_strategy,
+                max_workers=parallelism,
+                on_progress=lambda n: progress.update(task, advance=n),
             )
         
         # Show results
@@ -1261,12 +1410,12 @@ def drive_move_duplicates(
     "-i",
     "input_file",
     required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=_INPUT_PATH,
     help="JSON file from drive-scan or drive-scan-docs",
 )
 @click.option(
     "--keep-strategy",
-    type=click.Choice(["first", "last", "newest", "oldest", "largest", "smallest"]),
+    type=click.Choice(_STRATEGY_CHOICES),
     default="first",
     help="Which file to keep (others will be trashed)",
 )
@@ -1318,12 +1467,12 @@ def drive_trash(
             --keep-strategy newest \\
             --confirm
     """
+    from rich.table import Table
     from image_organizer.platforms.google_drive import GoogleDriveClient
 
     try:
         # Load duplicates JSON
-        with input_file.open("r") as f:
-            duplicates = json.load(f)
+        duplicates = load_json(input_file)
         
         if not duplicates:
             console.print("[yellow]No duplicates found in input file.[/yellow]")
@@ -1343,15 +1492,7 @@ def drive_trash(
         console.print(f"[yellow]💾 Space to recover: {size_gb:.2f} GB ({size_mb:.0f} MB)[/yellow]\n")
         
         # Show strategy
-        strategy_desc = {
-            "first": "first file in each group",
-            "last": "last file in each group",
-            "newest": "newest file (by modified date)",
-            "oldest": "oldest file (by modified date)",
-            "largest": "largest file (by size)",
-            "smallest": "smallest file (by size)",
-        }
-        console.print(f"[bold]Keep strategy:[/bold] {strategy_desc[keep_strategy]}\n")
+        console.print(f"[bold]Keep strategy:[/bold] {_STRATEGY_DESC[keep_strategy]}\n")
         
         # Show sample
         console.print("[bold cyan]Sample of files to trash:[/bold cyan]")
@@ -1361,26 +1502,20 @@ def drive_trash(
         table.add_column("File Name", width=50)
         table.add_column("Size", justify="right", width=10)
         
-        for group_num, (md5, file_list) in enumerate(list(duplicates.items())[:3], 1):
-            keep_idx = 0  # Simplified for preview
-            
-            for i, file in enumerate(file_list):
-                action = "[green]KEEP[/green]" if i == keep_idx else "[red]TRASH[/red]"
-                size_bytes = int(file.get("size", 0))
-                size_mb = size_bytes / (1024 * 1024)
-                size_display = f"{size_mb:.2f} MB" if size_mb >= 0.01 else f"{size_bytes / 1024:.1f} KB"
-                
-                name_display = file.get("name", "Unknown")
-                if len(name_display) > 50:
-                    name_display = name_display[:47] + "..."
-                
-                table.add_row(
-                    f"{group_num}" if i == 0 else "",
-                    action,
-                    name_display,
-                    size_display,
-                )
-        
+        # Precompute all display cells, then feed Rich in one pass
+        rows = [
+            (
+                f"{group_num}" if i == 0 else "",
+                "[green]KEEP[/green]" if i == 0 else "[red]TRASH[/red]",
+                _truncate(file.get("name", "Unknown"), 50),
+                _fmt_size(int(file.get("size") or 0)),
+            )
+            for group_num, (md5, file_list) in enumerate(islice(duplicates.items(), 3), 1)
+            for i, file in enumerate(file_list)
+        ]
+        for row in rows:
+            table.add_row(*row)
+
         console.print(table)
         
         if len(duplicates) > 3:
@@ -1444,7 +1579,7 @@ def drive_trash(
     "-i",
     "input_file",
     required=True,
-    type=click.Path(exists=True, path_type=Path),
+    type=_INPUT_PATH,
     help="JSON file with duplicates (can be edited to select specific files)",
 )
 @click.option(
@@ -1460,7 +1595,7 @@ def drive_trash(
 )
 @click.option(
     "--keep-strategy",
-    type=click.Choice(["first", "last", "newest", "oldest", "largest", "smallest"]),
+    type=click.Choice(_STRATEGY_CHOICES),
     default="first",
     help="Which file to keep in each group",
 )
@@ -1512,12 +1647,12 @@ def drive_execute(
             --action trash \\
             --dry-run
     """
+    from rich.table import Table
     from image_organizer.platforms.google_drive import GoogleDriveClient
 
     try:
         # Load and validate JSON
-        with input_file.open("r") as f:
-            duplicates = json.load(f)
+        duplicates = load_json(input_file)
         
         if not duplicates:
             console.print("[yellow]No duplicates found in input file.[/yellow]")
@@ -1557,21 +1692,19 @@ def drive_execute(
         table.add_column("Action", width=8)
         table.add_column("File Name", width=50)
         
-        for group_num, (md5, file_list) in enumerate(list(duplicates.items())[:5], 1):
-            keep_idx = 0  # Simplified
-            
-            for i, file in enumerate(file_list):
-                action_display = "[green]KEEP[/green]" if i == keep_idx else f"[yellow]{action_verb}[/yellow]"
-                name_display = file.get("name", "Unknown")
-                if len(name_display) > 50:
-                    name_display = name_display[:47] + "..."
-                
-                table.add_row(
-                    f"{group_num}" if i == 0 else "",
-                    action_display,
-                    name_display,
-                )
-        
+        # Precompute all display cells, then feed Rich in one pass
+        rows = [
+            (
+                f"{group_num}" if i == 0 else "",
+                "[green]KEEP[/green]" if i == 0 else f"[yellow]{action_verb}[/yellow]",
+                _truncate(file.get("name", "Unknown"), 50),
+            )
+            for group_num, (md5, file_list) in enumerate(islice(duplicates.items(), 5), 1)
+            for i, file in enumerate(file_list)
+        ]
+        for row in rows:
+            table.add_row(*row)
+
         console.print(table)
         
         if len(duplicates) > 5:
@@ -1641,13 +1774,13 @@ def drive_execute(
     "--local-path",
     "-l",
     required=True,
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    type=_DIR_PATH,
     help="Local directory to scan for images",
 )
 @click.option(
     "--output",
     "-o",
-    type=click.Path(path_type=Path),
+    type=_OUTPUT_PATH,
     help="Output JSON file (default: cross-platform-scan-<timestamp>.json)",
 )
 @click.option(
@@ -1678,6 +1811,7 @@ def cross_platform_scan(
       image-organizer cross-platform-scan -l ~/Downloads -o duplicates.json
     """
     from datetime import datetime
+    from rich.table import Table
     from image_organizer.core.cross_platform import CrossPlatformDetector
     from image_organizer.platforms.google_drive import GoogleDriveClient
     
@@ -1690,27 +1824,16 @@ def cross_platform_scan(
     
     # Scan local files
     console.print("[bold]Scanning local files...[/bold]")
-    local_count = 0
-    
+
     with console.status("[bold green]Scanning local directory..."):
+        # Phase 1: record candidates without hashing; only files whose
+        # size matches a Drive file get hashed in finalize() below
+        local_count = 0
         for ext in extensions:
             for file_path in local_path.rglob(f"*{ext}"):
                 if file_path.is_file():
-                    try:
-                        # Compute MD5 for local file
-                        md5 = detector._compute_md5(file_path)
-                        size = file_path.stat().st_size
-                        modified = datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                        
-                        detector.add_local_file(
-                            path=file_path,
-                            md5=md5,
-                            size=size,
-                            modified=modified,
-                        )
-                        local_count += 1
-                    except Exception as e:
-                        logger.warning(f"Skipping {file_path}: {e}")
+                    detector.add_local_candidate(file_path)
+                    local_count += 1
     
     console.print(f"[green]Found {local_count} local image files[/green]\n")
     
@@ -1748,6 +1871,9 @@ def cross_platform_scan(
     
     # Find cross-platform duplicates
     console.print("[bold]Detecting cross-platform duplicates...[/bold]")
+    with console.status("[bold green]Hashing size-matched local files..."):
+        # Phase 2: hash (in parallel) only candidates that can match
+        detector.finalize()
     duplicates = detector.find_cross_platform_duplicates()
     
     if not duplicates:
@@ -1825,9 +1951,8 @@ def cross_platform_scan(
         ],
     }
     
-    with open(output, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
-    
+    dump_json(results, output)
+
     console.print(f"\n[green]OK Results saved to:[/green] {output}")
     console.print("\n[cyan]💡 Recommendations:[/cyan]")
     console.print("  • Review the JSON file to see exact file locations")
@@ -1837,37 +1962,43 @@ def cross_platform_scan(
 
 def _display_duplicate_results(duplicates: dict) -> None:
     """Display duplicate detection results in a formatted table."""
+    from rich.console import Group
+    from rich.table import Table
+
     console.print(f"[bold green]Found {len(duplicates)} duplicate groups:[/bold green]\n")
 
-    for primary, dups in list(duplicates.items())[:10]:  # Show first 10 groups
+    tables = []
+    for primary, dups in islice(duplicates.items(), 10):  # Show first 10 groups
         table = Table(show_header=True, header_style="bold cyan")
         table.add_column("Primary Image")
         table.add_column("Duplicate")
         table.add_column("Similarity")
 
-        primary_name = Path(primary).name
-        table.add_row("[bold]{primary_name}[/bold]", "", "")
+        primary_name = os.path.basename(primary)
+        table.add_row(f"[bold]{primary_name}[/bold]", "", "")
 
-        for dup_path, score in dups:
-            dup_name = Path(dup_path).name
-            similarity = f"{100 - (score * 100 / 64):.1f}%"
-            table.add_row("", dup_name, similarity)
+        # Build the row data in one pass before handing it to Rich
+        rows = [
+            ("", os.path.basename(dup_path), f"{100 - score * _SIMILARITY_SCALE:.1f}%")
+            for dup_path, score in dups
+        ]
+        for row in rows:
+            table.add_row(*row)
 
-        console.print(table)
-        console.print()
+        tables.append(table)
+
+    # Render all groups in a single pass instead of one print per table
+    console.print(Group(*tables))
 
     if len(duplicates) > 10:
         console.print(f"[dim]... and {len(duplicates) - 10} more groups[/dim]\n")
 
 
-def _save_duplicates_json(duplicates: dict, output_path: Path) -> None:
+def _save_duplicates_json(
+    duplicates: dict, output_path: Path, pretty: bool = False
+) -> None:
     """Save duplicate results to JSON file."""
-    import json
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(duplicates, f, indent=2)
+    dump_json(duplicates, output_path, pretty=pretty)
 
 
 def main() -> None:
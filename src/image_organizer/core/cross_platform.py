@@ -1,15 +1,33 @@
 """Cross-platform duplicate detection (local + cloud)."""
 
 import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from image_organizer.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+def _new_md5(data: bytes = b""):
+    """
+    Create an MD5 object for file fingerprinting.
+
+    usedforsecurity=False picks OpenSSL's fast non-FIPS path; older
+    builds that don't accept the flag fall back to plain md5.
+    """
+    try:
+        return hashlib.md5(data, usedforsecurity=False)
+    except TypeError:
+        return hashlib.md5(data)
+
+
 @dataclass
 class FileInfo:
     """Information about a file (local or cloud)."""
@@ -33,17 +51,17 @@ class CrossPlatformDuplicate:
     local_files: List[FileInfo]
     drive_files: List[FileInfo]
     
-    @property
+    @cached_property
     def total_files(self) -> int:
         """Total number of files across platforms."""
         return len(self.local_files) + len(self.drive_files)
-    
-    @property
+
+    @cached_property
     def local_space(self) -> int:
         """Space used by local copies."""
         return sum(f.size for f in self.local_files)
-    
-    @property
+
+    @cached_property
     def drive_space(self) -> int:
         """Space used by Drive copies."""
         return sum(f.size for f in self.drive_files)
@@ -54,8 +72,12 @@ class CrossPlatformDetector:
     
     def __init__(self):
         """Initialize cross-platform detector."""
-        self.local_files: Dict[str, FileInfo] = {}  # md5 -> FileInfo
-        self.drive_files: Dict[str, FileInfo] = {}  # md5 -> FileInfo
+        self.local_files: Dict[str, List[FileInfo]] = {}  # md5 -> files
+        self.drive_files: Dict[str, List[FileInfo]] = {}  # md5 -> files
+        # Local candidates recorded but not yet hashed (see finalize)
+        self._pending_local: List[Tuple[Path, int, Optional[str]]] = []
+        # Memoized result, invalidated whenever a file is added
+        self._dup_cache: Optional[List[CrossPlatformDuplicate]] = None
         
     def add_local_file(
         self,
@@ -73,18 +95,20 @@ class CrossPlatformDetector:
             size: File size in bytes
             modified: Modification date (ISO format)
         """
-        if not path.exists():
+        # No exists() pre-check: callers hand us paths the scanner just
+        # yielded, so open/stat directly and tolerate the rare race
+        try:
+            # Compute MD5 if not provided
+            if md5 is None:
+                md5 = self._compute_md5(path)
+
+            # Get size if not provided
+            if size is None:
+                size = path.stat().st_size
+        except FileNotFoundError:
             logger.warning(f"File not found: {path}")
             return
-            
-        # Compute MD5 if not provided
-        if md5 is None:
-            md5 = self._compute_md5(path)
-            
-        # Get size if not provided
-        if size is None:
-            size = path.stat().st_size
-            
+
         file_info = FileInfo(
             platform="local",
             path=str(path),
@@ -95,12 +119,130 @@ class CrossPlatformDetector:
         )
         
         # Store in dictionary (md5 as key)
-        if md5 not in self.local_files:
-            self.local_files[md5] = []
-        if not isinstance(self.local_files[md5], list):
-            self.local_files[md5] = [self.local_files[md5]]
-        self.local_files[md5].append(file_info)
+        self.local_files.setdefault(md5, []).append(file_info)
+        self._dup_cache = None
         
+    def add_local_candidate(
+        self,
+        path: Path,
+        size: Optional[int] = None,
+        modified: Optional[str] = None,
+    ) -> None:
+        """
+        Record a local file for deferred hashing.
+
+        Phase 1 of the two-phase flow: only files whose size matches a
+        Drive file can be MD5 duplicates, so candidates are stored
+        unhashed until finalize() knows the Drive sizes.
+
+        Args:
+            path: Local file path
+            size: File size in bytes (stat'd if not provided)
+            modified: Modification date (derived if not provided)
+        """
+        if size is None or modified is None:
+            try:
+                st = path.stat()
+            except OSError as e:
+                logger.warning(f"Skipping {path}: {e}")
+                return
+            if size is None:
+                size = st.st_size
+            if modified is None:
+                modified = datetime.fromtimestamp(st.st_mtime).isoformat()
+
+        self._pending_local.append((path, size, modified))
+
+    def finalize(self, workers: Optional[int] = None) -> int:
+        """
+        Hash pending local candidates whose size matches a Drive file.
+
+        Candidates whose size matches no Drive file cannot be MD5
+        duplicates of anything in the pool and are dropped without
+        hashing — typically the vast majority of a photo library.
+
+        Args:
+            workers: Thread count (default: min(32, 2x CPU count))
+
+        Returns:
+            Number of files hashed and added to the pool
+        """
+        pending, self._pending_local = self._pending_local, []
+        if not pending:
+            return 0
+
+        drive_sizes = {
+            f.size for group in self.drive_files.values() for f in group
+        }
+        matches = [
+            (path, size, modified)
+            for path, size, modified in pending
+            if size in drive_sizes
+        ]
+        logger.info(
+            f"Hashing {len(matches)} of {len(pending)} local candidates "
+            f"(size pre-filter)"
+        )
+        if not matches:
+            return 0
+
+        added = 0
+        max_workers = workers or min(32, (os.cpu_count() or 4) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._compute_md5, path): (path, size, modified)
+                for path, size, modified in matches
+            }
+            for future in as_completed(futures):
+                path, size, modified = futures[future]
+                try:
+                    md5 = future.result()
+                except Exception as e:
+                    logger.warning(f"Skipping {path}: {e}")
+                    continue
+                self.add_local_file(path=path, md5=md5, size=size, modified=modified)
+                added += 1
+
+        return added
+
+    def add_local_files(
+        self, paths: Iterable[Path], workers: Optional[int] = None
+    ) -> int:
+        """
+        Hash and add many local files in parallel.
+
+        hashlib releases the GIL while digesting, so a thread pool
+        scales hashing across cores up to storage bandwidth.
+
+        Args:
+            paths: Local file paths to add
+            workers: Thread count (default: min(32, 2x CPU count))
+
+        Returns:
+            Number of files successfully added
+        """
+
+        def _prepare(path: Path) -> Tuple[Path, str, int, str]:
+            st = path.stat()
+            md5 = self._compute_md5(path)
+            modified = datetime.fromtimestamp(st.st_mtime).isoformat()
+            return path, md5, st.st_size, modified
+
+        added = 0
+        max_workers = workers or min(32, (os.cpu_count() or 4) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_prepare, path): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    path, md5, size, modified = future.result()
+                except Exception as e:
+                    logger.warning(f"Skipping {futures[future]}: {e}")
+                    continue
+                self.add_local_file(path=path, md5=md5, size=size, modified=modified)
+                added += 1
+
+        return added
+
     def add_drive_file(
         self,
         file_id: str,
@@ -132,19 +274,23 @@ class CrossPlatformDetector:
         )
         
         # Store in dictionary (md5 as key)
-        if md5 not in self.drive_files:
-            self.drive_files[md5] = []
-        if not isinstance(self.drive_files[md5], list):
-            self.drive_files[md5] = [self.drive_files[md5]]
-        self.drive_files[md5].append(file_info)
+        self.drive_files.setdefault(md5, []).append(file_info)
+        self._dup_cache = None
         
     def find_cross_platform_duplicates(self) -> List[CrossPlatformDuplicate]:
         """
         Find files that exist on both local and Google Drive.
         
+        The result is memoized until another file is added, so callers
+        that print statistics and then list duplicates only pay for the
+        intersection once.
+
         Returns:
             List of cross-platform duplicates
         """
+        if self._dup_cache is not None:
+            return self._dup_cache
+
         duplicates = []
         
         # Find MD5 hashes that exist in both platforms
@@ -160,13 +306,7 @@ class CrossPlatformDetector:
         for md5 in common_md5s:
             local_list = self.local_files[md5]
             drive_list = self.drive_files[md5]
-            
-            # Ensure lists
-            if not isinstance(local_list, list):
-                local_list = [local_list]
-            if not isinstance(drive_list, list):
-                drive_list = [drive_list]
-                
+
             # Create duplicate entry
             duplicate = CrossPlatformDuplicate(
                 md5=md5,
@@ -179,10 +319,11 @@ class CrossPlatformDetector:
             
         # Sort by size (largest first)
         duplicates.sort(key=lambda d: d.size, reverse=True)
-        
+
+        self._dup_cache = duplicates
         return duplicates
     
-    def get_statistics(self) -> Dict[str, any]:
+    def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about cross-platform duplicates.
         
@@ -190,11 +331,14 @@ class CrossPlatformDetector:
             Dictionary with statistics
         """
         duplicates = self.find_cross_platform_duplicates()
-        
-        total_local_space = sum(d.local_space for d in duplicates)
-        total_drive_space = sum(d.drive_space for d in duplicates)
-        total_files = sum(d.total_files for d in duplicates)
-        
+
+        # Accumulate all three totals in a single pass
+        total_local_space = total_drive_space = total_files = 0
+        for d in duplicates:
+            total_local_space += d.local_space
+            total_drive_space += d.drive_space
+            total_files += d.total_files
+
         return {
             "duplicate_groups": len(duplicates),
             "total_files": total_files,
@@ -206,21 +350,27 @@ class CrossPlatformDetector:
     def _compute_md5(self, path: Path) -> str:
         """
         Compute MD5 hash of a file.
-        
+
+        Hashes in large blocks inside C (hashlib.file_digest releases
+        the GIL) instead of an 8 KiB Python-level read loop; older
+        interpreters fall back to hashing an mmap of the file.
+
         Args:
             path: File path
-            
+
         Returns:
             MD5 hash as hexadecimal string
         """
-        md5 = hashlib.md5()
-        
         try:
             with open(path, "rb") as f:
-                # Read in chunks for memory efficiency
-                for chunk in iter(lambda: f.read(8192), b""):
-                    md5.update(chunk)
-            return md5.hexdigest()
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    return hashlib.file_digest(f, _new_md5).hexdigest()
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return _new_md5(mm).hexdigest()
+                except (ValueError, OSError):
+                    # Empty file or mmap unavailable
+                    return _new_md5(f.read()).hexdigest()
         except Exception as e:
             logger.error(f"Failed to compute MD5 for {path}: {e}")
             raise
@@ -229,3 +379,5 @@ class CrossPlatformDetector:
         """Clear all stored files."""
         self.local_files = {}
         self.drive_files = {}
+        self._pending_local = []
+        self._dup_cache = None
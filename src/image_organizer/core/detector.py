@@ -1,20 +1,78 @@
 """Duplicate detection using imagededup library."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-try:
-    from imagededup.methods import AHash, DHash, PHash, WHash
-    IMAGEDEDUP_AVAILABLE = True
-except ImportError:
-    IMAGEDEDUP_AVAILABLE = False
-    AHash = DHash = PHash = WHash = None
+import numpy as np
 
+from image_organizer.core.hash_cache import HashCache
 from image_organizer.utils.config import Config
 from image_organizer.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Per-byte popcount lookup, used when numpy predates bitwise_count (2.0)
+_POPCOUNT_TABLE = np.array(
+    [bin(i).count("1") for i in range(256)], dtype=np.uint8
+)
+
+# Rows of the pairwise distance matrix computed per block so the working
+# set stays cache-resident for large collections
+_HAMMING_BLOCK_SIZE = 4096
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Count set bits per element of a uint64 array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    # Fall back to a byte-wise table lookup
+    bytes_view = values.view(np.uint8).reshape(*values.shape, 8)
+    return _POPCOUNT_TABLE[bytes_view].sum(axis=-1, dtype=np.uint16)
+
+
+@lru_cache(maxsize=4)
+def _make_hasher(hash_method: str, verbose: bool) -> object:
+    """
+    Build (and cache) an imagededup hasher for a hash method.
+
+    Hasher construction pulls in imagededup's heavy dependency chain,
+    so the import is deferred to first use and instances are reused
+    across DuplicateDetector instantiations.
+
+    Args:
+        hash_method: Lowercased hash method name
+        verbose: Show imagededup progress output
+
+    Returns:
+        Hasher instance
+    """
+    try:
+        from imagededup.methods import AHash, DHash, PHash, WHash
+    except ImportError:
+        raise ImportError(
+            "imagededup is not installed. For now, only local scanning with imagededup is supported.\n"
+            "Note: imagededup requires C++ build tools on Windows.\n"
+            "Alternative: Use Google Drive scanning which works without imagededup."
+        )
+
+    hash_methods = {
+        "phash": PHash,
+        "dhash": DHash,
+        "ahash": AHash,
+        "whash": WHash,
+    }
+
+    hasher_class = hash_methods.get(hash_method)
+    if not hasher_class:
+        logger.warning(f"Unknown hash method '{hash_method}', using PHash")
+        hasher_class = PHash
+
+    logger.info(f"Using {hasher_class.__name__} for duplicate detection")
+    return hasher_class(verbose=verbose)
+
 
 class DuplicateDetector:
     """Detects duplicate and near-duplicate images using imagededup."""
@@ -32,39 +90,17 @@ class DuplicateDetector:
         self.hash_method = config.get("hash_method", "phash")
         self.threshold = config.get("similarity_threshold", 10)
 
-        # Initialize the appropriate hasher
-        self.hasher = self._get_hasher()
-
-    def _get_hasher(self) -> object:
-        """
-        Get the appropriate imagededup hasher based on configuration.
-
-        Returns:
-            Hasher instance
-        """
-        if not IMAGEDEDUP_AVAILABLE:
-            raise ImportError(
-                "imagededup is not installed. For now, only local scanning with imagededup is supported.\n"
-                "Note: imagededup requires C++ build tools on Windows.\n"
-                "Alternative: Use Google Drive scanning which works without imagededup."
-            )
-        
-        hash_methods = {
-            "phash": PHash,
-            "dhash": DHash,
-            "ahash": AHash,
-            "whash": WHash,
-        }
+        # Initialize the appropriate hasher (cached across instances)
+        self.hasher = _make_hasher(self.hash_method.lower(), show_progress)
 
-        hasher_class = hash_methods.get(self.hash_method.lower())
-        if not hasher_class:
-            logger.warning(
-                f"Unknown hash method '{self.hash_method}', using PHash"
+        # Sidecar cache so re-scans of unchanged files skip hashing
+        try:
+            self.hash_cache: Optional[HashCache] = HashCache(
+                config.get_hash_cache_path()
             )
-            hasher_class = PHash
-
-        logger.info(f"Using {hasher_class.__name__} for duplicate detection")
-        return hasher_class(verbose=self.show_progress)
+        except Exception as e:
+            logger.warning(f"Hash cache unavailable, hashing everything: {e}")
+            self.hash_cache = None
 
     def find_duplicates(
         self,
@@ -93,16 +129,12 @@ class DuplicateDetector:
             f"(threshold: {threshold})"
         )
 
-        # Convert Path objects to strings for imagededup
-        image_dir = self._find_common_parent(image_paths)
-        
         try:
-            # Use imagededup to find duplicates
-            duplicates = self.hasher.find_duplicates(
-                image_dir=str(image_dir) if image_dir else None,
-                max_distance_threshold=threshold,
-                scores=True,
-                recursive=True,
+            # Hash (cache-aware), then compare with the vectorized
+            # kernel instead of imagededup's per-pair Python loop
+            encoding_map = self.compute_hashes(image_paths)
+            duplicates = self.find_duplicates_from_hashes(
+                encoding_map, threshold
             )
 
             logger.info(f"Found {len(duplicates)} duplicate groups")
@@ -112,6 +144,53 @@ class DuplicateDetector:
             logger.error(f"Error during duplicate detection: {e}")
             raise
 
+    def find_duplicates_from_hashes(
+        self,
+        encoding_map: Dict[str, str],
+        threshold: Optional[int] = None,
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Find duplicates among precomputed perceptual hashes.
+
+        Packs the hex hash strings into a contiguous uint64 array and
+        computes pairwise Hamming distances with vectorized XOR and
+        popcount, blocked so each tile of the distance matrix stays in
+        cache. Output matches imagededup's find_duplicates format.
+
+        Args:
+            encoding_map: Mapping of file names to hex hash strings,
+                as returned by compute_hashes
+            threshold: Optional Hamming distance threshold
+
+        Returns:
+            Dictionary mapping each file to its duplicates with scores
+        """
+        threshold = threshold if threshold is not None else self.threshold
+
+        names = list(encoding_map)
+        hashes = np.array(
+            [int(h, 16) for h in encoding_map.values()], dtype=np.uint64
+        )
+
+        duplicates: Dict[str, List[Tuple[str, float]]] = {
+            name: [] for name in names
+        }
+
+        for start in range(0, len(hashes), _HAMMING_BLOCK_SIZE):
+            block = hashes[start:start + _HAMMING_BLOCK_SIZE]
+            distances = _popcount(
+                np.bitwise_xor(block[:, np.newaxis], hashes[np.newaxis, :])
+            )
+            for row, col in np.argwhere(distances <= threshold):
+                i = start + int(row)
+                j = int(col)
+                if i != j:
+                    duplicates[names[i]].append(
+                        (names[j], float(distances[row, col]))
+                    )
+
+        return duplicates
+
     def find_duplicates_to_remove(
         self,
         image_paths: List[Path],
@@ -135,13 +214,12 @@ class DuplicateDetector:
 
         threshold = threshold if threshold is not None else self.threshold
 
-        image_dir = self._find_common_parent(image_paths)
-
         try:
+            # Hand over precomputed hashes so imagededup doesn't re-walk
+            # and re-decode the tree with its own traversal
             files_to_remove = self.hasher.find_duplicates_to_remove(
-                image_dir=str(image_dir) if image_dir else None,
+                encoding_map=self.compute_hashes(image_paths),
                 max_distance_threshold=threshold,
-                recursive=True,
             )
 
             logger.info(f"Identified {len(files_to_remove)} files to remove")
@@ -151,44 +229,6 @@ class DuplicateDetector:
             logger.error(f"Error finding files to remove: {e}")
             raise
 
-    def _find_common_parent(self, paths: List[Path]) -> Optional[Path]:
-        """
-        Find the common parent directory for a list of paths.
-
-        Args:
-            paths: List of file paths
-
-        Returns:
-            Common parent directory or None
-        """
-        if not paths:
-            return None
-
-        # Get all unique parent directories
-        parents = {p.parent for p in paths}
-
-        # If all files are in the same directory, return it
-        if len(parents) == 1:
-            return list(parents)[0]
-
-        # Find common ancestor
-        common_parts = list(paths[0].parts)
-        for path in paths[1:]:
-            parts = list(path.parts)
-            # Find where paths diverge
-            for i, (a, b) in enumerate(zip(common_parts, parts)):
-                if a != b:
-                    common_parts = common_parts[:i]
-                    break
-            else:
-                # One path is a parent of the other
-                common_parts = common_parts[:min(len(common_parts), len(parts))]
-
-        if common_parts:
-            return Path(*common_parts)
-        
-        return None
-
     def compute_hash(self, image_path: Path) -> str:
         """
         Compute perceptual hash for a single image.
@@ -212,23 +252,71 @@ class DuplicateDetector:
         """
         Compute perceptual hashes for multiple images.
 
+        Hashes are looked up in the sidecar cache first, keyed by
+        (path, mtime_ns, size, method); only files that are new or have
+        changed since the last scan are actually decoded and hashed.
+
         Args:
             image_paths: List of image paths
 
         Returns:
             Dictionary mapping file paths to hash strings
         """
-        image_dir = self._find_common_parent(image_paths)
-
-        try:
-            encoding_map = self.hasher.encode_images(
-                image_dir=str(image_dir) if image_dir else None,
-                recursive=True,
+        encoding_map: Dict[str, str] = {}
+        misses: List[Tuple[str, int, int]] = []
+
+        for path in image_paths:
+            key = str(path)
+            try:
+                st = path.stat()
+            except OSError as e:
+                logger.warning(f"Skipping {path}: {e}")
+                continue
+
+            cached = (
+                self.hash_cache.get(
+                    key, st.st_mtime_ns, st.st_size, self.hash_method
+                )
+                if self.hash_cache
+                else None
             )
+            if cached is not None:
+                encoding_map[key] = cached
+            else:
+                misses.append((key, st.st_mtime_ns, st.st_size))
+
+        # Encode misses in parallel; PIL releases the GIL while decoding
+        new_rows = []
+        if misses:
+            max_workers = min(32, os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.hasher.encode_image, image_file=key): (
+                        key,
+                        mtime_ns,
+                        size,
+                    )
+                    for key, mtime_ns, size in misses
+                }
+                for future in as_completed(futures):
+                    key, mtime_ns, size = futures[future]
+                    try:
+                        hash_value = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to hash {key}: {e}")
+                        continue
+                    if hash_value is None:
+                        continue
+                    encoding_map[key] = hash_value
+                    new_rows.append(
+                        (key, mtime_ns, size, self.hash_method, hash_value)
+                    )
+
+        if self.hash_cache and new_rows:
+            self.hash_cache.put_many(new_rows)
 
-            logger.info(f"Computed hashes for {len(encoding_map)} images")
-            return encoding_map
-
-        except Exception as e:
-            logger.error(f"Error computing hashes: {e}")
-            raise
+        logger.info(
+            f"Computed hashes for {len(encoding_map)} images "
+            f"({len(encoding_map) - len(new_rows)} from cache)"
+        )
+        return encoding_map
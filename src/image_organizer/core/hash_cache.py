@@ -0,0 +1,87 @@
+"""Persistent cache of perceptual hashes keyed by file identity."""
+
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+from image_organizer.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    PRIMARY KEY (path, method)
+)
+"""
+
+
+class HashCache:
+    """
+    SQLite-backed cache of perceptual hashes.
+
+    A cached hash is only reused when the file's (mtime_ns, size) still
+    match what was recorded, so edited or replaced files re-hash
+    naturally. Re-scans of an unchanged tree then cost a stat() per
+    file instead of a decode + hash.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (creating if needed) the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(
+        self, path: str, mtime_ns: int, size: int, method: str
+    ) -> Optional[str]:
+        """
+        Look up a cached hash for a file.
+
+        Args:
+            path: Absolute file path
+            mtime_ns: Current modification time in nanoseconds
+            size: Current file size in bytes
+            method: Hash method name (e.g. "phash")
+
+        Returns:
+            Cached hash string, or None on miss or stale entry
+        """
+        row = self._conn.execute(
+            "SELECT hash FROM hashes"
+            " WHERE path = ? AND method = ? AND mtime_ns = ? AND size = ?",
+            (path, method, mtime_ns, size),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_many(
+        self, rows: Iterable[Tuple[str, int, int, str, str]]
+    ) -> None:
+        """
+        Insert or refresh cache entries in a single transaction.
+
+        Args:
+            rows: (path, mtime_ns, size, method, hash) tuples
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO hashes"
+                " (path, mtime_ns, size, method, hash) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
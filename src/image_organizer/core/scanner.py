@@ -1,8 +1,9 @@
 """File scanner for discovering images in directories."""
 
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Set
+from typing import Iterator, List, Optional, Set, Tuple
 
 from tqdm import tqdm
 
@@ -11,23 +12,43 @@ from image_organizer.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Recursive scans fan the walk out across threads once the root has
+# more than this many subdirectories
+_PARALLEL_SUBDIR_THRESHOLD = 4
+
+# Windows hidden-attribute call, bound once at import so the walk isn't
+# re-resolving ctypes.windll attributes per entry; None elsewhere
+# (POSIX hidden entries are caught by the dot-name check)
+_FILE_ATTRIBUTE_HIDDEN = 0x02
+_INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+if os.name == "nt":
+    import ctypes
+
+    _GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+else:
+    _GetFileAttributesW = None
+
 
 class ImageScanner:
     """Scans directories for image files with progress tracking."""
 
-    # Supported image extensions
-    IMAGE_EXTENSIONS = {
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".bmp",
-        ".webp",
-        ".heic",
-        ".heif",
-        ".tiff",
-        ".tif",
-    }
+    # Supported image extensions (without the dot; see _is_image_file)
+    IMAGE_EXTENSIONS = frozenset(
+        {
+            "jpg",
+            "jpeg",
+            "png",
+            "gif",
+            "bmp",
+            "webp",
+            "heic",
+            "heif",
+            "tiff",
+            "tif",
+        }
+    )
 
     def __init__(self, config: Config, show_progress: bool = True):
         """
@@ -67,23 +88,23 @@ class ImageScanner:
         logger.info(f"Scanning directory: {directory}")
 
         try:
-            # First pass: count total files for progress bar
-            all_files = self._discover_files(directory, recursive, skip_hidden)
-            total_files = len(all_files)
-
-            logger.info(f"Found {total_files} files to check")
-
-            # Second pass: filter image files with progress
-            image_files: List[Path] = []
-
-            if self.show_progress:
-                file_iter = tqdm(all_files, desc="Filtering images", unit="file")
+            # Filter extensions inline in a single pass over the walk.
+            # Recursive scans traverse with a thread pool (syscall
+            # latency overlaps); flat scans stream from the generator.
+            if recursive:
+                files_iter = self._walk_parallel(str(directory), skip_hidden)
             else:
-                file_iter = all_files
+                files_iter = self._iter_files(
+                    str(directory), recursive, skip_hidden
+                )
+            if self.show_progress:
+                files_iter = tqdm(files_iter, desc="Scanning images", unit="file")
 
-            for file_path in file_iter:
-                if self._is_image_file(file_path):
-                    image_files.append(file_path)
+            image_files = [
+                Path(file_path)
+                for file_path in files_iter
+                if self._is_image_file(file_path)
+            ]
 
             logger.info(f"Found {len(image_files)} image files")
             return image_files
@@ -92,87 +113,170 @@ class ImageScanner:
             logger.error(f"Permission denied: {e}")
             raise
 
-    def _discover_files(
-        self, directory: Path, recursive: bool, skip_hidden: bool
-    ) -> List[Path]:
+    def _iter_files(
+        self, root: str, recursive: bool, skip_hidden: bool
+    ) -> Iterator[str]:
         """
-        Discover all files in a directory.
+        Walk a directory with os.scandir, yielding file path strings.
+
+        Explicit stack-based DFS over plain strings: DirEntry caches
+        the file type from the directory read (no stat per entry), and
+        Path construction is deferred to the API boundary so the walk
+        itself allocates nothing but the path strings.
 
         Args:
-            directory: Directory to scan
-            recursive: Scan subdirectories
+            root: Directory path to walk
+            recursive: Recurse into subdirectories
             skip_hidden: Skip hidden files/folders
 
-        Returns:
-            List of all file paths
+        Yields:
+            File paths as the walk discovers them
         """
-        files: List[Path] = []
+        stack = [root]
+        while stack:
+            files, subdirs = self._scan_entries(stack.pop(), skip_hidden)
+            if recursive:
+                stack.extend(subdirs)
+            yield from files
 
+    def _scan_entries(
+        self, root: str, skip_hidden: bool
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Scan a single directory level.
+
+        Args:
+            root: Directory path to read
+            skip_hidden: Skip hidden files/folders
+
+        Returns:
+            Tuple of (file paths, subdirectory paths)
+        """
+        files: List[str] = []
+        subdirs: List[str] = []
         try:
-            if recursive:
-                for root, dirs, filenames in os.walk(directory):
-                    root_path = Path(root)
-
-                    # Skip hidden directories if requested
-                    if skip_hidden:
-                        dirs[:] = [d for d in dirs if not d.startswith(".")]
-                        # Also check for Windows hidden attribute
-                        dirs[:] = [
-                            d
-                            for d in dirs
-                            if not self._is_hidden_windows(root_path / d)
-                        ]
-
-                    # Skip symlinks and junctions to avoid loops
-                    dirs[:] = [
-                        d for d in dirs if not (root_path / d).is_symlink()
-                    ]
-
-                    for filename in filenames:
-                        file_path = root_path / filename
-
-                        # Skip hidden files
-                        if skip_hidden and (
-                            filename.startswith(".")
-                            or self._is_hidden_windows(file_path)
-                        ):
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    # Skip hidden entries
+                    if skip_hidden and (
+                        entry.name.startswith(".")
+                        or self._is_hidden_windows(entry.path)
+                    ):
+                        continue
+
+                    try:
+                        # Skip symlinks and junctions to avoid loops
+                        if entry.is_symlink():
                             continue
 
-                        # Skip symlinks
-                        if file_path.is_symlink():
-                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry.path)
+                    except OSError as e:
+                        logger.warning(f"Error reading entry {entry.path}: {e}")
+                        continue
+
+        except OSError as e:
+            # Permission denied, or the directory vanished/was replaced
+            # between discovery and this read; skip it rather than
+            # aborting the whole walk
+            logger.warning(f"Error accessing directory {root}: {e}")
+
+        return files, subdirs
+
+    def _walk_parallel(
+        self, root: str, skip_hidden: bool, max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Traverse a tree with concurrent scandir workers.
 
-                        files.append(file_path)
-            else:
-                # Non-recursive: only immediate children
-                for item in directory.iterdir():
-                    if item.is_file():
-                        if skip_hidden and (
-                            item.name.startswith(".")
-                            or self._is_hidden_windows(item)
-                        ):
-                            continue
-                        if not item.is_symlink():
-                            files.append(item)
+        Metadata walks are bound by syscall latency rather than CPU, so
+        several threads keeping readdir requests in flight overlap that
+        latency — the win is largest on network-mounted libraries.
+        Narrow trees (few top-level subdirectories) fall back to the
+        sequential walk, where a pool would only add overhead.
 
-        except PermissionError as e:
-            logger.warning(f"Permission denied accessing directory: {e}")
+        Args:
+            root: Directory path to walk
+            skip_hidden: Skip hidden files/folders
+            max_workers: Thread count (default: min(32, 4x CPU count))
+
+        Returns:
+            List of file path strings
+        """
+        files, subdirs = self._scan_entries(root, skip_hidden)
+        if len(subdirs) <= _PARALLEL_SUBDIR_THRESHOLD:
+            for subdir in subdirs:
+                files.extend(self._iter_files(subdir, True, skip_hidden))
+            return files
+
+        max_workers = max_workers or min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outstanding = {
+                executor.submit(self._scan_entries, subdir, skip_hidden)
+                for subdir in subdirs
+            }
+            while outstanding:
+                done, outstanding = wait(outstanding, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dir_files, dir_subdirs = future.result()
+                    files.extend(dir_files)
+                    outstanding.update(
+                        executor.submit(self._scan_entries, subdir, skip_hidden)
+                        for subdir in dir_subdirs
+                    )
 
         return files
 
-    def _is_image_file(self, file_path: Path) -> bool:
+    def scan_directory_iter(
+        self, directory: Path, recursive: bool = True, skip_hidden: bool = True
+    ) -> Iterator[Path]:
+        """
+        Yield image files from a directory as the walk discovers them.
+
+        Streaming variant of scan_directory: the extension filter runs
+        inline during traversal, so callers never hold the full file
+        list (and get no progress bar, since the total is unknown).
+
+        Args:
+            directory: Directory path to scan
+            recursive: Recursively scan subdirectories
+            skip_hidden: Skip hidden files and folders
+
+        Yields:
+            Image file paths
+
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+            ValueError: If path is not a directory
+        """
+        if not directory.exists():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+
+        if not directory.is_dir():
+            raise ValueError(f"Not a directory: {directory}")
+
+        for file_path in self._iter_files(str(directory), recursive, skip_hidden):
+            if self._is_image_file(file_path):
+                yield Path(file_path)
+
+    def _is_image_file(self, file_path: str) -> bool:
         """
         Check if a file is a supported image type.
 
+        rpartition yields the text after the last dot (empty for
+        extension-less names) without the list a split would build.
+
         Args:
             file_path: File path to check
 
         Returns:
             True if file is a supported image
         """
-        return file_path.suffix.lower() in self.IMAGE_EXTENSIONS
+        return file_path.rpartition(".")[2].lower() in self.IMAGE_EXTENSIONS
 
-    def _is_hidden_windows(self, path: Path) -> bool:
+    def _is_hidden_windows(self, path: "Path | str") -> bool:
         """
         Check if a path is hidden on Windows.
 
@@ -182,15 +286,14 @@ class ImageScanner:
         Returns:
             True if path is hidden on Windows
         """
-        if os.name != "nt":
+        if _GetFileAttributesW is None:
             return False
 
         try:
-            import ctypes
-
-            FILE_ATTRIBUTE_HIDDEN = 0x02
-            attrs = ctypes.windll.kernel32.GetFileAttributesW(str(path))
-            return attrs != -1 and (attrs & FILE_ATTRIBUTE_HIDDEN)
+            attrs = _GetFileAttributesW(str(path))
+            return attrs != _INVALID_FILE_ATTRIBUTES and bool(
+                attrs & _FILE_ATTRIBUTE_HIDDEN
+            )
         except Exception:
             return False
 
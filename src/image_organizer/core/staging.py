@@ -270,6 +270,33 @@ class SafeImageDeleter:
             logger.error(f"Error confirming deletion {operation_id}: {e}")
             return False
 
+    def get_operation(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load metadata for a single operation by ID.
+
+        Reads the operation's metadata file directly rather than listing
+        and parsing every staged operation.
+
+        Args:
+            operation_id: ID of the operation to load
+
+        Returns:
+            Operation metadata dictionary, or None if not found
+        """
+        metadata_file = self.staging_dir / operation_id / "operation.json"
+
+        if not metadata_file.exists():
+            return None
+
+        try:
+            with open(metadata_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(
+                f"Error reading operation metadata {operation_id}: {e}"
+            )
+            return None
+
     def list_staged_operations(self) -> List[Dict[str, Any]]:
         """
         List all staged operations.
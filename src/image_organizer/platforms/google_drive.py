@@ -7,9 +7,13 @@ Drive API v3 MD5 checksums and thumbnail-based perceptual hashing.
 
 import json
 import logging
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from google.auth.transport.requests import Request
@@ -28,6 +32,39 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Selector/key pairs for keep-strategy resolution; "first" and "last"
+# are positional and handled without a scan
+_KEEP_STRATEGY_KEYS = {
+    "newest": (max, lambda f: f.get("modifiedTime", "")),
+    "oldest": (min, lambda f: f.get("modifiedTime", "")),
+    "largest": (max, lambda f: int(f.get("size", 0))),
+    "smallest": (min, lambda f: int(f.get("size", 0))),
+}
+
+
+def _resolve_keep_index(
+    file_list: List[Dict[str, Any]], keep_strategy: str
+) -> int:
+    """
+    Index of the file to keep in a duplicate group.
+
+    Args:
+        file_list: Files in the group
+        keep_strategy: One of first/last/newest/oldest/largest/smallest
+
+    Returns:
+        Index into file_list of the file to keep
+    """
+    if keep_strategy == "last":
+        return len(file_list) - 1
+
+    picker = _KEEP_STRATEGY_KEYS.get(keep_strategy)
+    if picker is None:  # "first" or unknown
+        return 0
+
+    select, key = picker
+    return select(enumerate(file_list), key=lambda pair: key(pair[1]))[0]
+
 # Google Drive API scopes
 # Updated to include write permissions for moving files and creating folders
 SCOPES = [
@@ -122,6 +159,9 @@ class GoogleDriveClient:
         
         self.credentials: Optional[Credentials] = None
         self.service = None
+        # Per-thread transports: the service object is shareable, but
+        # the httplib2.Http it wraps is not thread-safe
+        self._local = threading.local()
     
     def authenticate(self) -> bool:
         """
@@ -250,20 +290,22 @@ class GoogleDriveClient:
         
         try:
             # Get current parents
-            file = self.service.files().get(
+            file = self._execute_with_retry(
+                self.service.files().get,
                 fileId=file_id,
-                fields="parents"
-            ).execute()
-            
+                fields="parents",
+            )
+
             previous_parents = ",".join(file.get("parents", []))
-            
+
             # Move the file
-            self.service.files().update(
+            self._execute_with_retry(
+                self.service.files().update,
                 fileId=file_id,
                 addParents=target_folder_id,
                 removeParents=previous_parents,
-                fields="id, parents"
-            ).execute()
+                fields="id, parents",
+            )
             
             logger.info(f"Moved file {file_id} to folder {target_folder_id}")
             return True
@@ -280,10 +322,12 @@ class GoogleDriveClient:
         duplicates: Dict[str, List[Dict[str, Any]]],
         folder_name: Optional[str] = None,
         keep_strategy: str = "first",
+        max_workers: int = 8,
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> Tuple[int, int, str]:
         """
         Move duplicate files to a review folder.
-        
+
         Args:
             duplicates: Dict of MD5 -> list of file dicts (from find_exact_duplicates_by_md5)
             folder_name: Name for review folder (auto-generated if None)
@@ -294,7 +338,9 @@ class GoogleDriveClient:
                 - "oldest": Keep oldest file (by modifiedTime)
                 - "largest": Keep largest file
                 - "smallest": Keep smallest file
-        
+            max_workers: Concurrent move requests in flight
+            on_progress: Called with 1 as each move completes
+
         Returns:
             Tuple of (files_moved, files_kept, folder_id)
         """
@@ -320,38 +366,39 @@ class GoogleDriveClient:
         
         logger.info(f"Created review folder: {folder_name} ({folder_id})")
         
-        files_moved = 0
         files_kept = 0
-        
-        # Process each duplicate group
+        files_to_move: List[Dict[str, Any]] = []
+
+        # First pass: decide what to keep, collect everything else
         for md5, file_list in duplicates.items():
             if len(file_list) < 2:
                 continue
-            
-            # Determine which file to keep
-            if keep_strategy == "last":
-                keep_idx = len(file_list) - 1
-            elif keep_strategy == "newest":
-                keep_idx = max(range(len(file_list)), key=lambda i: file_list[i].get("modifiedTime", ""))
-            elif keep_strategy == "oldest":
-                keep_idx = min(range(len(file_list)), key=lambda i: file_list[i].get("modifiedTime", ""))
-            elif keep_strategy == "largest":
-                keep_idx = max(range(len(file_list)), key=lambda i: int(file_list[i].get("size", 0)))
-            elif keep_strategy == "smallest":
-                keep_idx = min(range(len(file_list)), key=lambda i: int(file_list[i].get("size", 0)))
-            else:  # "first" or default
-                keep_idx = 0
-            
-            # Move all except the one we're keeping
+
+            keep_idx = _resolve_keep_index(file_list, keep_strategy)
+
             for i, file in enumerate(file_list):
                 if i == keep_idx:
                     logger.info(f"Keeping: {file.get('name')} (ID: {file.get('id')})")
                     files_kept += 1
                 else:
-                    logger.info(f"Moving: {file.get('name')} (ID: {file.get('id')})")
-                    if self.move_file(file.get("id"), folder_id):
-                        files_moved += 1
-        
+                    files_to_move.append(file)
+
+        # Second pass: issue the moves concurrently; each move is an
+        # independent metadata update dominated by request latency
+        files_moved = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.move_file, file.get("id"), folder_id): file
+                for file in files_to_move
+            }
+            for future in as_completed(futures):
+                file = futures[future]
+                logger.info(f"Moving: {file.get('name')} (ID: {file.get('id')})")
+                if future.result():
+                    files_moved += 1
+                if on_progress:
+                    on_progress(1)
+
         logger.info(f"Moved {files_moved} files, kept {files_kept} files")
         return (files_moved, files_kept, folder_id)
     
@@ -416,20 +463,8 @@ class GoogleDriveClient:
             if len(file_list) < 2:
                 continue
             
-            # Determine which file to keep
-            if keep_strategy == "last":
-                keep_idx = len(file_list) - 1
-            elif keep_strategy == "newest":
-                keep_idx = max(range(len(file_list)), key=lambda i: file_list[i].get("modifiedTime", ""))
-            elif keep_strategy == "oldest":
-                keep_idx = min(range(len(file_list)), key=lambda i: file_list[i].get("modifiedTime", ""))
-            elif keep_strategy == "largest":
-                keep_idx = max(range(len(file_list)), key=lambda i: int(file_list[i].get("size", 0)))
-            elif keep_strategy == "smallest":
-                keep_idx = min(range(len(file_list)), key=lambda i: int(file_list[i].get("size", 0)))
-            else:  # "first" or default
-                keep_idx = 0
-            
+            keep_idx = _resolve_keep_index(file_list, keep_strategy)
+
             # Trash all except the one we're keeping
             for i, file in enumerate(file_list):
                 if i == keep_idx:
@@ -468,6 +503,44 @@ class GoogleDriveClient:
         Returns:
             List of file metadata dictionaries
         """
+        iterator = self.iter_image_files(
+            page_size=page_size,
+            folder_id=folder_id,
+            folder_name=folder_name,
+            recursive=recursive,
+            mime_types=mime_types,
+            exclude_mime_types=exclude_mime_types,
+        )
+
+        # islice stops consuming mid-page, so pagination halts as soon as
+        # the cap is reached instead of fetching the remaining pages
+        if max_results:
+            files = list(islice(iterator, max_results))
+        else:
+            files = list(iterator)
+
+        logger.info(f"Found {len(files)} image files in Google Drive")
+        return files
+
+    def iter_image_files(
+        self,
+        page_size: int = 100,
+        folder_id: Optional[str] = None,
+        folder_name: Optional[str] = None,
+        recursive: bool = True,
+        mime_types: Optional[List[str]] = None,
+        exclude_mime_types: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over image files in Google Drive, page by page.
+
+        Yields file metadata as each API page arrives, so callers can
+        cap or filter the stream without holding the full listing in
+        memory. Arguments match list_image_files.
+
+        Yields:
+            File metadata dictionaries
+        """
         if not self.service:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
         
@@ -515,13 +588,15 @@ class GoogleDriveClient:
                 logger.info(f"Scanning folder {folder_id} (non-recursive)")
         
         # Fields to request (partial fields for efficiency)
-        fields = "nextPageToken, files(id, name, mimeType, size, md5Checksum, createdTime, modifiedTime, thumbnailLink)"
+        # Partial-response projection: request only the fields consumers
+        # actually read (thumbnailLink feeds near-duplicate downloads)
+        fields = "nextPageToken, files(id, name, mimeType, size, md5Checksum, modifiedTime, thumbnailLink)"
         
-        files = []
         page_token = None
-        
+        total = 0
+
         logger.info(f"Listing image files from Google Drive (query: {query})")
-        
+
         try:
             while True:
                 # Execute request with pagination
@@ -533,28 +608,22 @@ class GoogleDriveClient:
                     pageSize=min(page_size, 1000),
                     pageToken=page_token,
                 )
-                
+
                 page_files = results.get("files", [])
-                files.extend(page_files)
-                
-                logger.debug(f"Retrieved {len(page_files)} files (total: {len(files)})")
-                
-                # Check if we've reached max_results
-                if max_results and len(files) >= max_results:
-                    files = files[:max_results]
-                    break
-                
+                total += len(page_files)
+
+                logger.debug(f"Retrieved {len(page_files)} files (total: {total})")
+
+                yield from page_files
+
                 # Check for next page
                 page_token = results.get("nextPageToken")
                 if not page_token:
                     break
-        
+
         except HttpError as e:
             logger.error(f"Drive API error: {e}")
             raise
-        
-        logger.info(f"Found {len(files)} image files in Google Drive")
-        return files
     
     def find_exact_duplicates_by_md5(
         self, 
@@ -571,18 +640,17 @@ class GoogleDriveClient:
         """
         if files is None:
             files = self.list_image_files()
-        
-        # Group files by MD5 checksum
-        md5_groups: Dict[str, List[Dict[str, Any]]] = {}
-        
+
+        # Group files by MD5 checksum; defaultdict keeps the hot loop to
+        # one dict probe and one append per file
+        md5_groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
         for file in files:
             md5 = file.get("md5Checksum")
             if not md5:
                 logger.debug(f"File {file.get('name')} has no MD5 checksum, skipping")
                 continue
-            
-            if md5 not in md5_groups:
-                md5_groups[md5] = []
+
             md5_groups[md5].append(file)
         
         # Filter to only duplicates (2+ files with same MD5)
@@ -603,6 +671,7 @@ class GoogleDriveClient:
         self,
         file_id: str,
         output_path: Path,
+        thumbnail_link: Optional[str] = None,
     ) -> bool:
         """
         Download thumbnail for a file.
@@ -610,29 +679,32 @@ class GoogleDriveClient:
         Args:
             file_id: Google Drive file ID
             output_path: Path to save thumbnail
+            thumbnail_link: Known thumbnail URL (skips the metadata fetch;
+                list_image_files already returns one per file)
 
         Returns:
             True if download successful, False otherwise
         """
         if not self.service:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
-        
+
         try:
-            # Get file metadata with thumbnail link
-            file_metadata = self._execute_with_retry(
-                self.service.files().get,
-                fileId=file_id,
-                fields="thumbnailLink",
-            )
-            
-            thumbnail_link = file_metadata.get("thumbnailLink")
+            if thumbnail_link is None:
+                # Get file metadata with thumbnail link
+                file_metadata = self._execute_with_retry(
+                    self.service.files().get,
+                    fileId=file_id,
+                    fields="thumbnailLink",
+                )
+                thumbnail_link = file_metadata.get("thumbnailLink")
+
             if not thumbnail_link:
                 logger.debug(f"No thumbnail available for file {file_id}")
                 return False
             
-            # Download thumbnail
-            import requests
-            response = requests.get(
+            # Download thumbnail; the per-thread session also reuses
+            # connections across a worker's downloads
+            response = self._get_thread_session().get(
                 thumbnail_link,
                 headers={"Authorization": f"Bearer {self.credentials.token}"},
             )
@@ -656,10 +728,11 @@ class GoogleDriveClient:
         thumbnail_dir: Path,
         threshold: int = 10,
         max_files: Optional[int] = None,
+        max_workers: int = 8,
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Find near-duplicate images using perceptual hashing.
-        
+
         Downloads thumbnails from Google Drive and uses imagededup's PHash
         algorithm to detect visually similar images.
 
@@ -668,6 +741,7 @@ class GoogleDriveClient:
             thumbnail_dir: Directory to store downloaded thumbnails
             threshold: Hamming distance threshold (0-64, lower = more similar)
             max_files: Maximum number of files to process (for testing)
+            max_workers: Concurrent thumbnail downloads
 
         Returns:
             Dict mapping file IDs to lists of similar files
@@ -689,20 +763,37 @@ class GoogleDriveClient:
         # Create thumbnail directory
         thumbnail_dir.mkdir(parents=True, exist_ok=True)
         
-        # Download thumbnails (with progress tracking)
+        # Download thumbnails concurrently; each download is a plain HTTPS
+        # GET against the thumbnailLink returned by the listing, so the
+        # work is latency-bound and threads overlap the round trips
         files_to_process = files[:max_files] if max_files else files
         downloaded_files = []
-        
-        for i, file in enumerate(files_to_process, 1):
-            file_id = file["id"]
-            thumbnail_path = thumbnail_dir / f"{file_id}.jpg"
-            
-            if i % 10 == 0:
-                logger.info(f"Downloaded {i}/{len(files_to_process)} thumbnails")
-            
-            if self.download_thumbnail(file_id, thumbnail_path):
-                downloaded_files.append({**file, "thumbnail_path": str(thumbnail_path)})
-        
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for file in files_to_process:
+                file_id = file["id"]
+                thumbnail_path = thumbnail_dir / f"{file_id}.jpg"
+                future = executor.submit(
+                    self.download_thumbnail,
+                    file_id,
+                    thumbnail_path,
+                    thumbnail_link=file.get("thumbnailLink"),
+                )
+                futures[future] = (file, thumbnail_path)
+
+            for i, future in enumerate(as_completed(futures), 1):
+                if i % 10 == 0:
+                    logger.info(
+                        f"Downloaded {i}/{len(files_to_process)} thumbnails"
+                    )
+
+                file, thumbnail_path = futures[future]
+                if future.result():
+                    downloaded_files.append(
+                        {**file, "thumbnail_path": str(thumbnail_path)}
+                    )
+
         logger.info(f"Successfully downloaded {len(downloaded_files)} thumbnails")
         
         if not downloaded_files:
@@ -768,6 +859,7 @@ class GoogleDriveClient:
         thumbnail_dir: Path,
         phash_threshold: int = 10,
         include_near_duplicates: bool = True,
+        max_workers: int = 8,
     ) -> Dict[str, Any]:
         """
         Find both exact (MD5) and near (perceptual hash) duplicates.
@@ -777,6 +869,7 @@ class GoogleDriveClient:
             thumbnail_dir: Directory for thumbnail storage
             phash_threshold: Hamming distance threshold for near-duplicates
             include_near_duplicates: Whether to detect near-duplicates
+            max_workers: Concurrent thumbnail downloads for near-duplicates
 
         Returns:
             Dict with 'exact' and 'near' duplicate groups:
@@ -801,7 +894,10 @@ class GoogleDriveClient:
         if include_near_duplicates and IMAGEDEDUP_AVAILABLE:
             logger.info("Finding near-duplicates by perceptual hashing...")
             near_duplicates = self.find_near_duplicates_by_phash(
-                files, thumbnail_dir, threshold=phash_threshold
+                files,
+                thumbnail_dir,
+                threshold=phash_threshold,
+                max_workers=max_workers,
             )
             result['near'] = near_duplicates
         elif include_near_duplicates:
@@ -961,6 +1057,46 @@ class GoogleDriveClient:
             logger.error(f"Error getting subfolders: {e}")
             return all_subfolders
     
+    def _get_thread_http(self):
+        """
+        Get an authorized HTTP transport owned by the calling thread.
+
+        googleapiclient's service object can be shared across threads,
+        but the httplib2.Http it wraps cannot: concurrent execute()
+        calls on one transport interleave request/response on shared
+        per-host connections. Each thread gets its own AuthorizedHttp
+        instead.
+
+        Returns:
+            AuthorizedHttp bound to this client's credentials
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def _get_thread_session(self):
+        """
+        Get a requests.Session owned by the calling thread.
+
+        Sessions pool connections per host but are not guaranteed safe
+        for concurrent use, so each download worker keeps its own.
+
+        Returns:
+            requests.Session for this thread
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests
+
+            session = requests.Session()
+            self._local.session = session
+        return session
+
     def _execute_with_retry(
         self,
         api_call,
@@ -970,6 +1106,9 @@ class GoogleDriveClient:
         """
         Execute API call with exponential backoff retry.
 
+        The request runs on the calling thread's own transport, so this
+        is safe to invoke from worker threads.
+
         Args:
             api_call: API method to call
             max_retries: Maximum number of retries
@@ -983,7 +1122,7 @@ class GoogleDriveClient:
         """
         for attempt in range(max_retries):
             try:
-                return api_call(**kwargs).execute()
+                return api_call(**kwargs).execute(http=self._get_thread_http())
             
             except HttpError as e:
                 # Check if error is retryable (429 = rate limit, 500+ = server error)
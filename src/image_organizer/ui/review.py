@@ -5,6 +5,7 @@ Provides side-by-side comparison of duplicates with interactive controls.
 """
 
 import logging
+import os.path
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from datetime import datetime
@@ -319,21 +320,23 @@ class ReviewUI:
         self.console.print("[dim]Auto-accepting recommendation for this group.[/dim]")
     
     def show_final_confirmation(
-        self, 
-        to_delete: List[Path],
-        to_keep: List[Path]
+        self,
+        to_delete: "List[str | Path]",
+        to_keep: "List[str | Path]",
     ) -> bool:
         """
         Show final confirmation before deletion.
-        
+
         Args:
-            to_delete: List of files marked for deletion
-            to_keep: List of files to keep
-        
+            to_delete: List of file paths marked for deletion
+            to_keep: List of file paths to keep
+
         Returns:
             True if user confirms, False otherwise
         """
-        total_size = sum(p.stat().st_size for p in to_delete if p.exists())
+        total_size = sum(
+            os.path.getsize(p) for p in to_delete if os.path.exists(p)
+        )
         size_mb = total_size / (1024 * 1024)
         
         panel = Panel(
@@ -2,5 +2,6 @@
 
 from image_organizer.utils.config import Config
 from image_organizer.utils.logger import setup_logger
+from image_organizer.utils.serialization import dump_json, dumps_json, load_json
 
-__all__ = ["Config", "setup_logger"]
+__all__ = ["Config", "dump_json", "dumps_json", "load_json", "setup_logger"]
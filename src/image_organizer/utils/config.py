@@ -16,6 +16,7 @@ class Config:
     DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "config.json"
     DEFAULT_STAGING_DIR = DEFAULT_CONFIG_DIR / "staging"
     DEFAULT_OPERATIONS_LOG = DEFAULT_CONFIG_DIR / "operations.log"
+    DEFAULT_HASH_CACHE = DEFAULT_CONFIG_DIR / "hash_cache.db"
 
     DEFAULT_SETTINGS = {
         "protected_folders": [
@@ -156,3 +157,7 @@ class Config:
     def get_operations_log(self) -> Path:
         """Get the operations log file path."""
         return self.DEFAULT_OPERATIONS_LOG
+
+    def get_hash_cache_path(self) -> Path:
+        """Get the perceptual hash cache database path."""
+        return self.DEFAULT_HASH_CACHE
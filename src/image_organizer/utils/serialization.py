@@ -0,0 +1,88 @@
+"""JSON serialization helpers with optional orjson acceleration."""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Buffer size for report writes; keeps large duplicate reports from
+# flushing in small pieces
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def dumps_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes.
+
+    Uses orjson when installed (the `perf` extra) and falls back to the
+    stdlib encoder. Output is compact by default; pass pretty=True for
+    human-readable reports.
+
+    Args:
+        data: JSON-serializable data
+        pretty: Indent output for human consumption
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None).encode("utf-8")
+
+
+def dump_json(data: Any, output_path: Path, pretty: bool = False) -> None:
+    """
+    Serialize data to a JSON file.
+
+    Args:
+        data: JSON-serializable data
+        output_path: Destination file path
+        pretty: Indent output for human consumption
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(dumps_json(data, pretty=pretty))
+
+
+def load_json(input_path: Path) -> Any:
+    """
+    Load JSON from a file.
+
+    Memory-maps the file so the decoder sees one contiguous buffer
+    instead of chunked reads; decodes with orjson when installed, stdlib
+    json otherwise.
+
+    Args:
+        input_path: Source file path
+
+    Returns:
+        Decoded JSON data
+    """
+    with open(input_path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file, or the platform/filesystem can't map it
+            payload = f.read()
+        else:
+            with mapped:
+                if ORJSON_AVAILABLE:
+                    view = memoryview(mapped)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        view.release()
+                payload = mapped.read()
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
@@ -0,0 +1,82 @@
+"""Test the duplicate detector's Hamming-distance kernel."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from image_organizer.utils.config import Config
+
+
+@pytest.fixture
+def detector():
+    """Create a DuplicateDetector with a stubbed imagededup hasher."""
+    from image_organizer.core.detector import DuplicateDetector
+
+    with patch("image_organizer.core.detector._make_hasher", return_value=Mock()):
+        yield DuplicateDetector(Config(), show_progress=False)
+
+
+def test_empty_encoding_map(detector):
+    """Test that an empty map yields no groups."""
+    assert detector.find_duplicates_from_hashes({}, threshold=10) == {}
+
+
+def test_single_entry_has_no_duplicates(detector):
+    """Test that a lone hash never matches itself."""
+    result = detector.find_duplicates_from_hashes(
+        {"a.jpg": "0000000000000000"}, threshold=10
+    )
+
+    assert result == {"a.jpg": []}
+
+
+def test_identical_hashes_match_symmetrically(detector):
+    """Test that equal hashes appear in each other's groups."""
+    result = detector.find_duplicates_from_hashes(
+        {"a.jpg": "00000000000000ff", "b.jpg": "00000000000000ff"},
+        threshold=0,
+    )
+
+    assert result["a.jpg"] == [("b.jpg", 0.0)]
+    assert result["b.jpg"] == [("a.jpg", 0.0)]
+
+
+def test_threshold_boundary_is_inclusive(detector):
+    """Test that distances at the threshold match and past it don't."""
+    # "0" vs "3": two differing bits; "0" vs "7": three
+    hashes = {
+        "base.jpg": "0000000000000000",
+        "near.jpg": "0000000000000003",
+        "far.jpg": "0000000000000007",
+    }
+
+    result = detector.find_duplicates_from_hashes(hashes, threshold=2)
+
+    assert ("near.jpg", 2.0) in result["base.jpg"]
+    assert all(name != "far.jpg" for name, _ in result["base.jpg"])
+
+
+def test_high_bit_hashes_parse_as_uint64(detector):
+    """Test hashes above 2^63 (high bit set) pack and compare correctly."""
+    result = detector.find_duplicates_from_hashes(
+        {"a.jpg": "ffffffffffffffff", "b.jpg": "7fffffffffffffff"},
+        threshold=1,
+    )
+
+    assert result["a.jpg"] == [("b.jpg", 1.0)]
+    assert result["b.jpg"] == [("a.jpg", 1.0)]
+
+
+def test_popcount_fallback_matches(detector):
+    """Test the byte-table popcount agrees with the bitwise_count path."""
+    import numpy as np
+
+    from image_organizer.core.detector import _POPCOUNT_TABLE
+
+    values = np.array([0, 1, 0xFF, 2**63, 2**64 - 1], dtype=np.uint64)
+    expected = [bin(int(v)).count("1") for v in values]
+
+    bytes_view = values.view(np.uint8).reshape(*values.shape, 8)
+    fallback = _POPCOUNT_TABLE[bytes_view].sum(axis=-1, dtype=np.uint16)
+
+    assert list(fallback) == expected
@@ -190,3 +190,44 @@ class TestGoogleDriveClient:
         
         with pytest.raises(HttpError):
             client._execute_with_retry(mock_api_call, max_retries=3)
+
+
+class TestResolveKeepIndex:
+    """Test keep-strategy resolution for duplicate groups."""
+
+    def setup_method(self):
+        """Set up a duplicate group with distinct times and sizes."""
+        from image_organizer.platforms.google_drive import _resolve_keep_index
+
+        self.resolve = _resolve_keep_index
+        self.files = [
+            {"id": "a", "modifiedTime": "2024-03-01T00:00:00Z", "size": "500"},
+            {"id": "b", "modifiedTime": "2024-01-01T00:00:00Z", "size": "2000"},
+            {"id": "c", "modifiedTime": "2024-06-01T00:00:00Z", "size": "100"},
+        ]
+
+    def test_first_and_last(self):
+        """Test positional strategies."""
+        assert self.resolve(self.files, "first") == 0
+        assert self.resolve(self.files, "last") == 2
+
+    def test_newest_and_oldest(self):
+        """Test modifiedTime strategies."""
+        assert self.resolve(self.files, "newest") == 2
+        assert self.resolve(self.files, "oldest") == 1
+
+    def test_largest_and_smallest(self):
+        """Test size strategies (Drive reports sizes as strings)."""
+        assert self.resolve(self.files, "largest") == 1
+        assert self.resolve(self.files, "smallest") == 2
+
+    def test_unknown_strategy_falls_back_to_first(self):
+        """Test that an unrecognized strategy keeps the first file."""
+        assert self.resolve(self.files, "best") == 0
+
+    def test_missing_size_treated_as_zero(self):
+        """Test that files without a size field don't break selection."""
+        files = [{"id": "a"}, {"id": "b", "size": "10"}]
+
+        assert self.resolve(files, "largest") == 1
+        assert self.resolve(files, "smallest") == 0
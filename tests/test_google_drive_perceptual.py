@@ -79,7 +79,7 @@ class TestGoogleDrivePerceptualHashing(unittest.TestCase):
         self.client.service = Mock()
         
         # Mock thumbnail downloads
-        def mock_download(file_id, path):
+        def mock_download(file_id, path, thumbnail_link=None):
             # Create a fake image file
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_bytes(b"fake_image_data")
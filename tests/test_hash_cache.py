@@ -0,0 +1,53 @@
+"""Test the perceptual hash cache module."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from image_organizer.core.hash_cache import HashCache
+
+
+@pytest.fixture
+def cache():
+    """Create a HashCache backed by a temporary database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = HashCache(Path(tmpdir) / "hash_cache.db")
+        yield cache
+        cache.close()
+
+
+def test_miss_on_empty_cache(cache):
+    """Test that an empty cache misses."""
+    assert cache.get("/photos/a.jpg", 100, 1024, "phash") is None
+
+
+def test_put_and_get(cache):
+    """Test that stored hashes are returned on exact identity match."""
+    cache.put_many([("/photos/a.jpg", 100, 1024, "phash", "deadbeef")])
+
+    assert cache.get("/photos/a.jpg", 100, 1024, "phash") == "deadbeef"
+
+
+def test_stale_entry_misses(cache):
+    """Test that changed mtime or size invalidates the entry."""
+    cache.put_many([("/photos/a.jpg", 100, 1024, "phash", "deadbeef")])
+
+    assert cache.get("/photos/a.jpg", 200, 1024, "phash") is None
+    assert cache.get("/photos/a.jpg", 100, 2048, "phash") is None
+
+
+def test_method_is_part_of_key(cache):
+    """Test that hashes from different methods don't collide."""
+    cache.put_many([("/photos/a.jpg", 100, 1024, "phash", "deadbeef")])
+
+    assert cache.get("/photos/a.jpg", 100, 1024, "dhash") is None
+
+
+def test_put_many_refreshes_existing(cache):
+    """Test that re-inserting a path updates its entry."""
+    cache.put_many([("/photos/a.jpg", 100, 1024, "phash", "deadbeef")])
+    cache.put_many([("/photos/a.jpg", 200, 2048, "phash", "cafef00d")])
+
+    assert cache.get("/photos/a.jpg", 200, 2048, "phash") == "cafef00d"
+    assert cache.get("/photos/a.jpg", 100, 1024, "phash") is None
@@ -0,0 +1,62 @@
+"""Test the JSON serialization helpers."""
+
+import json
+
+import pytest
+
+from image_organizer.utils.serialization import dump_json, dumps_json, load_json
+
+
+def test_dumps_json_compact_bytes():
+    """Test that default output is compact JSON bytes."""
+    payload = dumps_json({"a": 1, "b": [1, 2]})
+
+    assert isinstance(payload, bytes)
+    assert b"\n" not in payload
+    assert json.loads(payload) == {"a": 1, "b": [1, 2]}
+
+
+def test_dumps_json_pretty_indents():
+    """Test that pretty output is indented but parses identically."""
+    data = {"a": 1, "b": [1, 2]}
+    payload = dumps_json(data, pretty=True)
+
+    assert b"\n" in payload
+    assert json.loads(payload) == data
+
+
+def test_dump_and_load_roundtrip(tmp_path):
+    """Test that dump_json output loads back unchanged."""
+    data = {"groups": {"abc": [{"name": "fürst.jpg", "size": 123}]}, "n": None}
+    output = tmp_path / "report.json"
+
+    dump_json(data, output)
+
+    assert load_json(output) == data
+
+
+def test_dump_json_creates_parent_dirs(tmp_path):
+    """Test that missing output directories are created."""
+    output = tmp_path / "nested" / "dir" / "report.json"
+
+    dump_json({"ok": True}, output)
+
+    assert load_json(output) == {"ok": True}
+
+
+def test_load_json_empty_file_raises(tmp_path):
+    """Test that an empty file surfaces a JSON decode error."""
+    empty = tmp_path / "empty.json"
+    empty.touch()
+
+    with pytest.raises(json.JSONDecodeError):
+        load_json(empty)
+
+
+def test_load_json_reads_stdlib_written_file(tmp_path):
+    """Test that reports written by plain json.dump still load."""
+    data = {"a": [1, 2, 3]}
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    assert load_json(path) == data